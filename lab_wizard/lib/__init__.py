@@ -28,7 +28,7 @@
 
 # # General abstract base classes and interfaces
 # from lib.instruments.general.parent_child import (
-#     Dependency, Instrument, Params2Inst, CanInstantiate,
+#     Dependency, Instrument, CanInstantiate,
 #     ChildParams, ParentParams, Parent,
 #     ParentFactory, Child, ChannelProvider
 # )
@@ -93,7 +93,7 @@
 #     "Sim900Dep", "Sim900ChildDep",
 
 #     # Abstract base classes and interfaces
-#     "Dependency", "Instrument", "Params2Inst", "CanInstantiate",
+#     "Dependency", "Instrument", "CanInstantiate",
 #     "ChildParams", "ParentParams", "Parent",
 #     "ParentFactory", "Child", "ChannelProvider",
 #     "VSource", "StandInVSource",
@@ -91,6 +91,15 @@ class AndoAQ8201_31(AndoAQ8201Module):
         self.attenuation_range = (0, 60)  # dB
         self.attenuation_resolution = 0.05  # dB
 
+        # Static part of get_info(), built once
+        self._info_template: Dict[str, Any] = {
+            "instrument_type": "Ando AQ8201-31 Variable Optical Attenuator",
+            "slot": self.slot,
+            "wavelength_range_nm": self.wavelength_range,
+            "attenuation_range_db": self.attenuation_range,
+            "attenuation_resolution_db": self.attenuation_resolution,
+        }
+
     def connect(self) -> bool:
         """Connect to the attenuator module"""
         if super().connect():
@@ -274,16 +283,10 @@ class AndoAQ8201_31(AndoAQ8201Module):
 
     def get_info(self) -> Dict[str, Any]:
         """Get instrument information"""
-        info = {
-            "instrument_type": "Ando AQ8201-31 Variable Optical Attenuator",
-            "slot": self.slot,
-            "connected": self.is_connected(),
-            "wavelength_range_nm": self.wavelength_range,
-            "attenuation_range_db": self.attenuation_range,
-            "attenuation_resolution_db": self.attenuation_resolution,
-        }
+        connected = self.is_connected()
+        info = {**self._info_template, "connected": connected}
 
-        if self.is_connected():
+        if connected:
             try:
                 wavelength, attenuation = self.get_status()
                 info.update(
@@ -321,6 +324,12 @@ class AndoAQ8201_412(AndoAQ8201Module):
         self.current_switch = None
         self.current_position = None
 
+        # Static part of get_info(), built once
+        self._info_template: Dict[str, Any] = {
+            "instrument_type": "Ando AQ8201-412 Optical Switch",
+            "slot": self.slot,
+        }
+
     def connect(self) -> bool:
         """Connect to the switch module"""
         if super().connect():
@@ -376,8 +385,7 @@ class AndoAQ8201_412(AndoAQ8201Module):
     def get_info(self) -> Dict[str, Any]:
         """Get switch information"""
         return {
-            "instrument_type": "Ando AQ8201-412 Optical Switch",
-            "slot": self.slot,
+            **self._info_template,
             "connected": self.is_connected(),
             "current_switch": self.current_switch,
             "current_position": self.current_position,
@@ -0,0 +1,91 @@
+import logging
+from functools import partial
+from typing import ClassVar
+
+from lab_wizard.lib.instruments.dbay.addons.vsource import ChSourceState
+from lab_wizard.lib.instruments.dbay.comm import Comm
+from lab_wizard.lib.instruments.general.vsource import VSource
+
+logger = logging.getLogger(__name__)
+
+
+class DacChannel(VSource):
+    """Single vsource output channel of a DBay DAC module.
+
+    Shared by the Dac4D and Dac16D modules, which differ only in the
+    endpoint their channel changes are sent to.
+
+    Change payloads carry the same keys as VsourceChange. They are built
+    from a per-channel base dict rather than through the model, since only
+    bias_voltage/activated/measuring vary between calls.
+    """
+
+    __slots__ = (
+        "comm",
+        "module_slot",
+        "channel_data",
+        "channel_index",
+        "connected",
+        "_put",
+        "_base",
+    )
+
+    endpoint: ClassVar[str]
+
+    def __init__(self, comm: Comm, module_slot: int, state: ChSourceState):
+        self.comm = comm
+        self.module_slot = module_slot
+        self.channel_data = state
+        self.channel_index = state.index
+        self.connected = True
+        self._put = partial(comm.put, self.endpoint)
+        self._base = {
+            "module_index": module_slot,
+            "index": state.index,
+            "heading_text": state.heading_text,
+        }
+
+    def _send(self, bias_voltage: float, activated: bool, measuring: bool) -> None:
+        self._put(
+            data={
+                **self._base,
+                "bias_voltage": float(bias_voltage),
+                "activated": activated,
+                "measuring": measuring,
+            }
+        )
+
+    def disconnect(self) -> bool:  # type: ignore[override]
+        if not self.connected:
+            return True
+        try:
+            data = self.channel_data
+            self._send(data.bias_voltage, data.activated, measuring=False)
+        except Exception:
+            pass
+        self.connected = False
+        return True
+
+    def set_voltage(self, voltage: float) -> bool:  # type: ignore[override]
+        try:
+            self._send(voltage, self.channel_data.activated, measuring=True)
+            return True
+        except Exception as e:
+            logger.error("Error setting voltage on channel %d: %s", self.channel_index, e)
+            return False
+
+    def turn_on(self) -> bool:  # type: ignore[override]
+        try:
+            self._send(self.channel_data.bias_voltage, True, measuring=True)
+            return True
+        except Exception as e:
+            logger.error("Error turning on channel %d: %s", self.channel_index, e)
+            return False
+
+    def turn_off(self) -> bool:  # type: ignore[override]
+        try:
+            self._send(self.channel_data.bias_voltage, False, measuring=True)
+            return True
+        except Exception as e:
+            logger.error("Error turning off channel %d: %s", self.channel_index, e)
+            return False
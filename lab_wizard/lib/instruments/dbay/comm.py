@@ -1,12 +1,31 @@
 import requests
-from typing import Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterable, TypeVar
 from lab_wizard.lib.instruments.general.parent_child import Dependency
 
+try:  # optional fast JSON encoder; requests' stdlib json is used otherwise
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover
+    orjson = None  # type: ignore
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+T = TypeVar("T")
+R = TypeVar("R")
+
 
 class Comm(Dependency):
+    # Each call is an independent HTTP request to the DBay server.
+    concurrent_safe = True
+
     def __init__(self, server_address: str, port: int):
         self.server_address = server_address
         self.port = port
+        # Last "full-state" response. Modules instantiated from the same DBay
+        # share it instead of each re-fetching the whole chassis state.
+        self._full_state: dict[str, Any] | None = None
+        # Created on first use; shared by every module on this chassis.
+        self._pool: ThreadPoolExecutor | None = None
 
     def get(self, endpoint: str) -> dict[str, Any]:
         response = requests.get(f"http://{self.server_address}:{self.port}/{endpoint}")
@@ -15,11 +34,53 @@ class Comm(Dependency):
         else:
             raise Exception(f"Failed to get data from {endpoint}")
 
+    def get_full_state(self, refresh: bool = False) -> dict[str, Any]:
+        """Return the chassis "full-state", fetching it only when not cached.
+
+        The cache is dropped on every put(), so a fetch after any change made
+        through this Comm sees fresh data. Pass refresh=True to force a fetch.
+        """
+        if refresh or self._full_state is None:
+            self._full_state = self.get("full-state")
+        return self._full_state
+
     def put(self, endpoint: str, data: dict[str, Any]) -> dict[str, Any]:
-        response = requests.put(
-            f"http://{self.server_address}:{self.port}/{endpoint}", json=data
-        )
+        self._full_state = None
+        url = f"http://{self.server_address}:{self.port}/{endpoint}"
+        if orjson is not None:
+            response = requests.put(url, data=orjson.dumps(data), headers=_JSON_HEADERS)
+        else:
+            response = requests.put(url, json=data)
         if response.status_code == 200:
             return response.json()  # Assuming response.json() returns a dictionary
         else:
             raise Exception(f"Failed to put data to {endpoint}")
+
+    def map_concurrent(self, fn: Callable[[T], R], items: Iterable[T]) -> list[R]:
+        """Apply fn to each item on a shared thread pool, preserving order.
+
+        Used to overlap independent blocking requests (e.g. per-channel
+        PUTs on disconnect). Items the pool refuses to take, as happens
+        during interpreter shutdown, are run sequentially instead.
+        Exceptions raised by fn propagate to the caller.
+        """
+        items = list(items)
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(
+                max_workers=16, thread_name_prefix=f"dbay-{self.server_address}"
+            )
+        futures = []
+        try:
+            for item in items:
+                futures.append(self._pool.submit(fn, item))
+        except RuntimeError:
+            # Only submit() is guarded, so fn's own errors are never replayed
+            rest = [fn(item) for item in items[len(futures) :]]
+            return [f.result() for f in futures] + rest
+        return [f.result() for f in futures]
+
+    def close(self) -> None:
+        """Shut down the thread pool; map_concurrent starts a new one if needed."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
@@ -1,4 +1,4 @@
-from typing import Any, Annotated, TypeVar, cast, Literal
+from typing import Any, Annotated, TypeVar, Literal
 from pydantic import Field
 
 from lab_wizard.lib.instruments.dbay.comm import Comm
@@ -10,6 +10,11 @@ from lab_wizard.lib.instruments.general.parent_child import (
     ChildParams,
     CanInstantiate,
 )
+from lab_wizard.lib.instruments.general.parent_helpers import (
+    standard_add_child,
+    standard_init_child_by_key,
+    standard_init_children,
+)
 from lab_wizard.lib.instruments.dbay.modules.dac4d import Dac4DParams, Dac4D
 from lab_wizard.lib.instruments.dbay.modules.dac16d import Dac16DParams, Dac16D
 from lab_wizard.lib.instruments.dbay.modules.empty import EmptyParams, Empty
@@ -65,41 +70,40 @@ class DBay(
         self.comm = Comm(server_address, port)
         self.children: dict[str, Child[Comm, DBayChildParams]] = {}
         self._module_snapshot: list[Any] | None = None
-        if params is not None:
-            self.params = params
+        # Built here without re-validation when not supplied, so the rest of
+        # the class can rely on self.params existing.
+        if params is None:
+            params = DBayParams.from_trusted(server_address=server_address, port=port)
+        self.params = params
 
     @property
     def dep(self) -> Comm:
         return self.comm
 
     def init_child_by_key(self, key: str) -> Child[Comm, Any]:
-        params = self.params.children[key]
-        child_cls = params.inst
-        child = child_cls.from_params_with_dep(self.dep, key, params)  # type: ignore[arg-type]
-        self.children[key] = cast(Child[Comm, Any], child)
-        return child
+        return standard_init_child_by_key(self, key)
 
     def init_children(self) -> None:
-        for key in list(getattr(self, "params", DBayParams()).children.keys()):
-            self.init_child_by_key(key)
+        standard_init_children(self)
 
     def add_child(
         self,
         params: ChildParams[TChild],
         key: str,
     ) -> TChild:
-        # Ensure params container exists
-        if not hasattr(self, "params"):
-            self.params = DBayParams(server_address=self.server_address, port=self.port)
-        self.params.children[key] = params  # type: ignore[assignment]
-        child_cls = params.inst
-        child = child_cls.from_params_with_dep(self.dep, key, params)  # type: ignore[arg-type]
-        self.children[key] = cast(Child[Comm, Any], child)
-        return child
+        return standard_add_child(self, params, key)  # type: ignore[return-value]
+
+    def disconnect(self) -> None:
+        """Disconnect every module, then release the Comm's thread pool."""
+        for child in self.children.values():
+            disconnect = getattr(child, "disconnect", None)
+            if disconnect is not None:
+                disconnect()
+        self.comm.close()
 
     # Back-compat helpers
     def load_full_state(self) -> None:
-        response = self.comm.get("full-state")
+        response = self.comm.get_full_state(refresh=True)
         data: list[dict[str, dict[str, Any]]] = response.get("data", [])
         # Make a simple snapshot list so previous callers can list modules
         snapshot: list[Any] = []
@@ -138,11 +142,11 @@ class DBay(
 
     def list_modules(self):
         modules = self.get_modules() or []
-        print("DBay Modules:")
-        print("-------------")
-        for i, module in enumerate(modules):
-            print(f"Slot {i}: {module}")
-        print("-------------")
+        rule = "-------------"
+        lines = ["DBay Modules:", rule]
+        lines += [f"Slot {i}: {module}" for i, module in enumerate(modules)]
+        lines.append(rule)
+        print("\n".join(lines))
         return modules
 
     @classmethod
@@ -1,3 +1,4 @@
+import logging
 from typing import Any, Literal, List
 
 from pydantic import BaseModel
@@ -9,90 +10,23 @@ from lab_wizard.lib.instruments.dbay.addons.vsource import (
     SharedVsourceChange,
     ChSourceState,
 )
+from lab_wizard.lib.instruments.dbay.channel import DacChannel
 from lab_wizard.lib.instruments.dbay.comm import Comm
 from lab_wizard.lib.instruments.dbay.state import Core
 from lab_wizard.lib.instruments.general.parent_child import Child, ChildParams, ChannelProvider
-from lab_wizard.lib.instruments.general.vsource import VSource
 
 
-# ---------------------- Params & State Models ----------------------
-
+logger = logging.getLogger(__name__)
 
-class _Dac16DChannel(VSource):
-    """Internal single channel implementation (no params object)."""
-
-    def __init__(self, comm: Comm, module_slot: int, state: ChSourceState):
-        self.comm = comm
-        self.module_slot = module_slot
-        self.channel_data = state
-        self.channel_index = state.index
-        self.connected = True
 
-    def disconnect(self) -> bool:  # type: ignore[override]
-        if not self.connected:
-            return True
-        try:
-            change = VsourceChange(
-                module_index=self.module_slot,
-                index=self.channel_index,
-                bias_voltage=self.channel_data.bias_voltage,
-                activated=self.channel_data.activated,
-                heading_text=self.channel_data.heading_text,
-                measuring=False,
-            )
-            self.comm.put("dac16D/vsource/", data=change.model_dump())
-        except Exception:
-            pass
-        self.connected = False
-        return True
+# ---------------------- Params & State Models ----------------------
 
-    def set_voltage(self, voltage: float) -> bool:  # type: ignore[override]
-        try:
-            change = VsourceChange(
-                module_index=self.module_slot,
-                index=self.channel_index,
-                bias_voltage=voltage,
-                activated=self.channel_data.activated,
-                heading_text=self.channel_data.heading_text,
-                measuring=True,
-            )
-            self.comm.put("dac16D/vsource/", data=change.model_dump())
-            return True
-        except Exception as e:
-            print(f"Error setting voltage on channel {self.channel_index}: {e}")
-            return False
 
-    def turn_on(self) -> bool:  # type: ignore[override]
-        try:
-            change = VsourceChange(
-                module_index=self.module_slot,
-                index=self.channel_index,
-                bias_voltage=self.channel_data.bias_voltage,
-                activated=True,
-                heading_text=self.channel_data.heading_text,
-                measuring=True,
-            )
-            self.comm.put("dac16D/vsource/", data=change.model_dump())
-            return True
-        except Exception as e:
-            print(f"Error turning on channel {self.channel_index}: {e}")
-            return False
+class _Dac16DChannel(DacChannel):
+    """Internal single channel implementation (no params object)."""
 
-    def turn_off(self) -> bool:  # type: ignore[override]
-        try:
-            change = VsourceChange(
-                module_index=self.module_slot,
-                index=self.channel_index,
-                bias_voltage=self.channel_data.bias_voltage,
-                activated=False,
-                heading_text=self.channel_data.heading_text,
-                measuring=True,
-            )
-            self.comm.put("dac16D/vsource/", data=change.model_dump())
-            return True
-        except Exception as e:
-            print(f"Error turning off channel {self.channel_index}: {e}")
-            return False
+    __slots__ = ()
+    endpoint = "dac16D/vsource/"
 
 
 class Dac16DParams(ChildParams["Dac16D"]):
@@ -122,18 +56,22 @@ class Dac16DState(BaseModel):
 
 
 class Dac16D(Child[Comm, Dac16DParams], ChannelProvider[_Dac16DChannel]):
-    def __init__(self, data: dict[str, Any], comm: Comm):
+    def __init__(
+        self, data: dict[str, Any], comm: Comm, params: Dac16DParams | None = None
+    ):
         self.comm = comm
         self.data = Dac16DState(**data)
         self.core = Core(
             slot=self.data.core.slot, type=self.data.core.type, name=self.data.core.name
         )
-        self.params = Dac16DParams()
-        self.connected = True
+        # Reuse the params the module was configured with; the default needs
+        # no validation.
+        self.params = params if params is not None else Dac16DParams.from_trusted()
         self.channels: list[_Dac16DChannel] = [
             _Dac16DChannel(self.comm, self.core.slot, st)
             for st in self.data.vsource.channels[: self.params.num_channels]
         ]
+        self.connected = True
 
     @property
     def parent_class(self) -> str:
@@ -147,14 +85,14 @@ class Dac16D(Child[Comm, Dac16DParams], ChannelProvider[_Dac16DChannel]):
             slot = int(key)
         except ValueError:
             raise TypeError(f"Dac16D requires numeric key for slot, got {key!r}")
-        full = parent_dep.get("full-state")
+        full = parent_dep.get_full_state()
         data_list = full.get("data", [])
         module_info = data_list[slot]
         if module_info["core"]["type"] != "dac16D":
             raise ValueError(
                 f"Slot {slot} is not dac16D (found {module_info['core']['type']})"
             )
-        return cls(module_info, parent_dep)
+        return cls(module_info, parent_dep, params)  # type: ignore[arg-type]
 
     @property
     def dep(self) -> Comm:  # type: ignore[override]
@@ -163,16 +101,14 @@ class Dac16D(Child[Comm, Dac16DParams], ChannelProvider[_Dac16DChannel]):
     def disconnect(self) -> bool:  # type: ignore[override]
         if not self.connected:
             return True
-        for ch in getattr(self, "channels", []):
-            try:
-                ch.disconnect()
-            except Exception:
-                pass
+        # Each channel disconnect is a blocking PUT; overlap them.
+        self.comm.map_concurrent(_Dac16DChannel.disconnect, self.channels)
         self.connected = False
         return True
 
     def __del__(self):  # pragma: no cover
-        if hasattr(self, "connected") and self.connected:
+        if getattr(self, "connected", False):
+            logger.debug("Cleaning up Dac16D instance slot=%s", self.core.slot)
             self.disconnect()
 
     def __str__(self):
@@ -223,7 +159,7 @@ class Dac16D(Child[Comm, Dac16DParams], ChannelProvider[_Dac16DChannel]):
 
             return True
         except Exception as e:
-            print(f"Error setting shared voltage: {e}")
+            logger.error("Error setting shared voltage: %s", e)
             return False
 
     def set_vsb(self, voltage: float, activated: bool = True) -> bool:
@@ -245,5 +181,5 @@ class Dac16D(Child[Comm, Dac16DParams], ChannelProvider[_Dac16DChannel]):
             self.data.vsb.measuring = True
             return True
         except Exception as e:
-            print(f"Error setting VSB voltage: {e}")
+            logger.error("Error setting VSB voltage: %s", e)
             return False
@@ -1,91 +1,21 @@
+import copy
+import logging
 from lab_wizard.lib.instruments.dbay.comm import Comm
-from lab_wizard.lib.instruments.dbay.addons.vsource import VsourceChange, ChSourceState, IVsourceAddon
+from lab_wizard.lib.instruments.dbay.addons.vsource import IVsourceAddon
+from lab_wizard.lib.instruments.dbay.channel import DacChannel
 from lab_wizard.lib.instruments.dbay.state import Core
-from typing import Literal
 from lab_wizard.lib.instruments.general.parent_child import Child, ChildParams, ChannelProvider
-from lab_wizard.lib.instruments.general.vsource import VSource
 from pydantic import BaseModel
-from typing import Any, TypeVar
+from typing import Any, Literal
 
-# TypeVar for method-level inference
-TChild = TypeVar("TChild", bound=Child[Comm, Any])
+logger = logging.getLogger(__name__)
 
 
-class _Dac4DChannel(VSource):
+class _Dac4DChannel(DacChannel):
     """Single output channel for Dac4D (internal helper, no params object)."""
 
-    def __init__(self, comm: Comm, module_slot: int, state: ChSourceState):
-        self.comm = comm
-        self.module_slot = module_slot
-        self.channel_data = state
-        self.channel_index = state.index
-        self.connected = True
-
-    def disconnect(self) -> bool:  # type: ignore[override]
-        if not self.connected:
-            return True
-        try:
-            change = VsourceChange(
-                module_index=self.module_slot,
-                index=self.channel_index,
-                bias_voltage=self.channel_data.bias_voltage,
-                activated=self.channel_data.activated,
-                heading_text=self.channel_data.heading_text,
-                measuring=False,
-            )
-            self.comm.put("dac4D/vsource/", data=change.model_dump())
-        except Exception:
-            pass
-        self.connected = False
-        return True
-
-    def set_voltage(self, voltage: float) -> bool:  # type: ignore[override]
-        try:
-            change = VsourceChange(
-                module_index=self.module_slot,
-                index=self.channel_index,
-                bias_voltage=voltage,
-                activated=self.channel_data.activated,
-                heading_text=self.channel_data.heading_text,
-                measuring=True,
-            )
-            self.comm.put("dac4D/vsource/", data=change.model_dump())
-            return True
-        except Exception as e:
-            print(f"Error setting voltage on channel {self.channel_index}: {e}")
-            return False
-
-    def turn_on(self) -> bool:  # type: ignore[override]
-        try:
-            change = VsourceChange(
-                module_index=self.module_slot,
-                index=self.channel_index,
-                bias_voltage=self.channel_data.bias_voltage,
-                activated=True,
-                heading_text=self.channel_data.heading_text,
-                measuring=True,
-            )
-            self.comm.put("dac4D/vsource/", data=change.model_dump())
-            return True
-        except Exception as e:
-            print(f"Error turning on channel {self.channel_index}: {e}")
-            return False
-
-    def turn_off(self) -> bool:  # type: ignore[override]
-        try:
-            change = VsourceChange(
-                module_index=self.module_slot,
-                index=self.channel_index,
-                bias_voltage=self.channel_data.bias_voltage,
-                activated=False,
-                heading_text=self.channel_data.heading_text,
-                measuring=True,
-            )
-            self.comm.put("dac4D/vsource/", data=change.model_dump())
-            return True
-        except Exception as e:
-            print(f"Error turning off channel {self.channel_index}: {e}")
-            return False
+    __slots__ = ()
+    endpoint = "dac4D/vsource/"
 
 
 """
@@ -118,24 +48,24 @@ class Dac4DState(BaseModel):
     vsource: IVsourceAddon
 
 
-# TypeVar for method-level inference
-TChild = TypeVar("TChild", bound=Child[Comm, Any])
-
-
 class Dac4D(Child[Comm, Dac4DParams], ChannelProvider[_Dac4DChannel]):
-    def __init__(self, data: dict[str, Any], comm: Comm):
+    def __init__(
+        self, data: dict[str, Any], comm: Comm, params: Dac4DParams | None = None
+    ):
         self.comm = comm
         self.data = Dac4DState(**data)
         self.core = Core(
             slot=self.data.core.slot, type=self.data.core.type, name=self.data.core.name
         )
-        self.params = Dac4DParams()
-        self.connected = True
+        # Reuse the params the module was configured with; the default needs
+        # no validation.
+        self.params = params if params is not None else Dac4DParams.from_trusted()
         # Build internal channel objects
         self.channels: list[_Dac4DChannel] = [
             _Dac4DChannel(self.comm, self.core.slot, ch_state)
             for ch_state in self.data.vsource.channels[: self.params.num_channels]
         ]
+        self.connected = True
 
     @property
     def parent_class(self) -> str:
@@ -149,9 +79,11 @@ class Dac4D(Child[Comm, Dac4DParams], ChannelProvider[_Dac4DChannel]):
             slot = int(key)
         except ValueError:
             raise TypeError(f"Dac4D requires numeric key for slot, got {key!r}")
-        full = parent_dep.get("full-state")
+        full = parent_dep.get_full_state()
         data_list = full.get("data", [])
-        module_info = data_list[slot]
+        # Copied: the defaults patched in below must not leak into the
+        # full-state cache shared with the other modules on this Comm
+        module_info = copy.deepcopy(data_list[slot])
         if module_info["core"]["type"] != "dac4D":
             raise ValueError(
                 f"Slot {slot} is not dac4D (found {module_info['core']['type']})"
@@ -178,7 +110,7 @@ class Dac4D(Child[Comm, Dac4DParams], ChannelProvider[_Dac4DChannel]):
                     }
                 )
         module_info["vsource"]["channels"] = vs_channels
-        return cls(module_info, parent_dep)
+        return cls(module_info, parent_dep, params)  # type: ignore[arg-type]
 
     @property
     def dep(self) -> Comm:  # type: ignore[override]
@@ -187,16 +119,14 @@ class Dac4D(Child[Comm, Dac4DParams], ChannelProvider[_Dac4DChannel]):
     def disconnect(self) -> bool:  # type: ignore[override]
         if not self.connected:
             return True
-        for ch in getattr(self, "channels", []):
-            try:
-                ch.disconnect()
-            except Exception:
-                pass
+        # Each channel disconnect is a blocking PUT; overlap them.
+        self.comm.map_concurrent(_Dac4DChannel.disconnect, self.channels)
         self.connected = False
         return True
 
     def __del__(self):  # pragma: no cover - cleanup
-        if hasattr(self, "connected") and self.connected:
+        if getattr(self, "connected", False):
+            logger.debug("Cleaning up Dac4D instance slot=%s", self.core.slot)
             self.disconnect()
 
     def __str__(self):
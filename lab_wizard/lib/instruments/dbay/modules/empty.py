@@ -16,6 +16,8 @@ class EmptyParams(ChildParams["Empty"]):
 
 
 class Empty(Child[Comm, EmptyParams]):
+    __slots__ = ("data", "core")
+
     def __init__(self, data: dict[str, Any] | None = None):
         """Initialize an empty module."""
         if data:
@@ -6,8 +6,11 @@ Date: June 4, 2025
 Abstract base class for counter instruments.
 """
 
+import logging
 from abc import ABC, abstractmethod
 
+logger = logging.getLogger(__name__)
+
 
 class Counter(ABC):
     """
@@ -81,20 +84,18 @@ class StandInCounter(Counter):
     def __init__(self):
         self.connected = True  # Stand-in is always "connected"
         self.gate_time = 1.0
-        print("Stand-in counter instrument initialized.")
+        logger.debug("Stand-in counter instrument initialized.")
 
     def disconnect(self) -> bool:
-        print("This is not a real counter. Using stand-in Counter.")
+        logger.debug("This is not a real counter. Using stand-in Counter.")
         self.connected = False
         return not self.connected
 
     def count(self, gate_time: float = 1.0, channel: int | None = None) -> int:
-        channel_str = f" on channel {channel}" if channel is not None else ""
-        print(f"Stand-in: Counting for {gate_time}s{channel_str}")
+        logger.debug("Stand-in: Counting for %ss (channel %s)", gate_time, channel)
         return 0  # Default count value
 
     def set_gate_time(self, gate_time: float, channel: int | None = None) -> bool:
-        channel_str = f" on channel {channel}" if channel is not None else ""
-        print(f"Stand-in: Setting gate time to {gate_time}s{channel_str}")
+        logger.debug("Stand-in: Setting gate time to %ss (channel %s)", gate_time, channel)
         self.gate_time = gate_time
         return True
@@ -1,58 +1,259 @@
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from typing import Any, Iterable, Iterator
+
 from lab_wizard.lib.instruments.general.serial import SerialDep
 import time
 
 
+def _encode_cmd(cmd: str) -> bytes:
+    """Encode a command line. Not cached: most commands embed values (voltages,
+    slots), so fixed commands should be pre-encoded and sent via write_bytes."""
+    return cmd.encode() + b"\n"
+
+
 class GPIBComm:
     """
     GPIB communication layer that can use any underlying serial connection
     """
 
-    def __init__(self, serial_comm: SerialDep, gpibAddr: int, offline: bool = False):
+    __slots__ = (
+        "serial_comm",
+        "gpibAddr",
+        "offline",
+        "_addr_prefix",
+        "_track_addr",
+        "read_terminator",
+        "query_timeout",
+        "legacy_delay",
+        "_batch",
+    )
+
+    def __init__(
+        self,
+        serial_comm: SerialDep,
+        gpibAddr: int,
+        offline: bool = False,
+        read_terminator: bytes = b"\n",
+        query_timeout: float = 1.0,
+        legacy_delay: float | None = None,
+    ):
         """
         :param serial_comm: Shared SerialDep instance from parent connection
         :param gpibAddr: The GPIB address number [int]
-        :param **kwargs: Additional parameters
-            offline - if True, don't actually write/read over com
+        :param offline: if True, don't actually write/read over com
+        :param read_terminator: query() returns once this is received
+        :param query_timeout: max seconds query() waits for the terminator
+        :param legacy_delay: if set, query() sleeps this long and does a
+            single read instead of polling (for instruments that need it)
         """
         self.serial_comm = serial_comm
         self.gpibAddr = gpibAddr
         self.offline = offline
+        # Address select header, encoded once rather than on every write
+        self._addr_prefix = f"++addr {gpibAddr}\n".encode("ascii")
+        # Deps that record the selected address (LocalSerialDep) let us omit
+        # the header while the adapter is still pointed at this device.
+        self._track_addr = hasattr(serial_comm, "gpib_addr") and hasattr(
+            serial_comm, "lock"
+        )
+        self.read_terminator = read_terminator
+        self.query_timeout = query_timeout
+        self.legacy_delay = legacy_delay
+        # Writer collecting commands inside a batch() block, None otherwise
+        self._batch: BufferedGPIBWriter | None = None
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(gpibAddr={self.gpibAddr}, "
+            f"serial_comm={self.serial_comm!r}, offline={self.offline})"
+        )
 
     def write(self, cmd: str) -> int | None:
         """
         Write command to GPIB device
         :param cmd: The command to send
         :return: number of bytes written or True if offline
+            (0 while inside batch(), where the command is only queued)
         """
         if self.offline:
             return True
 
+        if self._batch is not None:
+            return self._batch.write(cmd)
         # Format command for GPIB
-        gpib_cmd = f"++addr {self.gpibAddr}\n{cmd}\n"
-        return self.serial_comm.write(gpib_cmd)
+        return self._send(_encode_cmd(cmd))
+
+    def write_bytes(self, line: bytes) -> int | None:
+        """
+        Write an already encoded, newline-terminated command
+        (e.g. a module-level constant like b"*IDN?\n")
+        :return: number of bytes written or True if offline
+        """
+        if self.offline:
+            return True
+        if self._batch is not None:
+            self._batch.write_bytes(line)
+            return 0
+        return self._send(line)
+
+    def write_many(self, cmds: Iterable[str]) -> int | None:
+        """
+        Write several commands in a single serial transaction
+        :param cmds: The commands to send, in order
+        :return: number of bytes written or True if offline
+            (0 while inside batch(), where the commands are only queued)
+        """
+        if self.offline:
+            return True
+
+        body = "".join(f"{cmd}\n" for cmd in cmds)
+        if not body:
+            return 0
+        if self._batch is not None:
+            # Queue behind commands already in the batch to keep their order
+            return self._batch.write_bytes(body.encode())
+        return self._send(body.encode())
+
+    def _send(self, body: bytes) -> int:
+        """Write body, prefixed with ++addr unless this address is selected."""
+        ser = self.serial_comm
+        if not self._track_addr:
+            return ser.write(self._addr_prefix + body)
+        with ser.lock:  # type: ignore[attr-defined]
+            if ser.gpib_addr == self.gpibAddr:  # type: ignore[attr-defined]
+                return ser.write(body)
+            n = ser.write(self._addr_prefix + body)
+            ser.gpib_addr = self.gpibAddr  # type: ignore[attr-defined]
+            return n
+
+    @contextmanager
+    def batch(self, max_frame: int = 2048) -> Iterator["BufferedGPIBWriter"]:
+        """
+        Route write() calls through a BufferedGPIBWriter for the block.
+
+        Commands are sent as one serial write on exit (or earlier, whenever
+        max_frame bytes are pending). Nested batch() blocks join the
+        outermost one. Unsent commands are dropped if the block raises. A
+        query() inside the block sends pending commands along with it.
+        """
+        if self._batch is not None:
+            yield self._batch
+            return
+        writer = self._batch = BufferedGPIBWriter(self, max_frame)
+        try:
+            yield writer
+        except BaseException:
+            writer.discard()
+            raise
+        finally:
+            self._batch = None
+        writer.flush()
 
     def read(self) -> bytes:
         """
         Read from GPIB device
-        :return: response from the device
+        :return: response from the device, up to and including
+            read_terminator (may be partial if query_timeout expires)
         """
         if self.offline:
             return b""
-        return self.serial_comm.read()
+        if self.legacy_delay is not None:
+            return self.serial_comm.read()
+        # Keep reading until the terminator arrives so callers don't get a
+        # short buffer and have to sleep and re-read themselves
+        terminator = self.read_terminator
+        deadline = time.monotonic() + self.query_timeout
+        buf = bytearray()
+        while True:
+            chunk = self.serial_comm.read()
+            if chunk:
+                buf += chunk
+                if buf.endswith(terminator):
+                    break
+            elif time.monotonic() >= deadline:
+                break
+            else:
+                time.sleep(0.001)
+        return bytes(buf)
 
     def query(self, cmd: str) -> bytes:
         """
         Query GPIB device (write then read)
         :param cmd: Command to send
-        :return: Response from device
+        :return: Response from device (may be partial if query_timeout expires)
+        """
+        if self.offline:
+            return b""
+        with self.port_lock():
+            if self._batch is not None:
+                self._batch.write(cmd)
+                self._batch.flush()
+            else:
+                self.write(cmd)
+            return self._read_response()
+
+    def port_lock(self) -> AbstractContextManager[Any]:
         """
-        self.write(cmd)
-        time.sleep(0.1)  # Small delay for response
+        Lock to hold across a multi-step exchange (e.g. write then read) so
+        other devices sharing the port cannot interleave and take the reply.
+        A no-op for serial deps without a lock.
+        """
+        if self._track_addr:
+            return self.serial_comm.lock  # type: ignore[attr-defined, no-any-return]
+        return nullcontext()
+
+    def _read_response(self) -> bytes:
+        """Read the reply to a query that has just been sent."""
+        if self.legacy_delay is not None:
+            time.sleep(self.legacy_delay)
         return self.read()
 
-    # connect/disconnect should be managed only by the SerialConnection class
-    # def connect(self) -> bool:
-    #     return self.serial_comm.connect()
 
-    # def disconnect(self) -> bool:
-    #     return self.serial_comm.disconnect()
+class BufferedGPIBWriter:
+    """
+    Coalesces commands for one GPIBComm into as few serial writes as possible.
+
+    Commands accumulate in a bytearray and are sent behind a single ++addr
+    header on flush(), on query(), or once max_frame bytes are pending.
+    Normally obtained from GPIBComm.batch().
+    """
+
+    __slots__ = ("gpib", "max_frame", "_buf")
+
+    def __init__(self, gpib: GPIBComm, max_frame: int = 2048):
+        self.gpib = gpib
+        self.max_frame = max_frame
+        self._buf = bytearray()
+
+    def write(self, cmd: str) -> int:
+        """
+        Queue a command
+        :return: number of bytes sent now (0 unless max_frame was reached)
+        """
+        return self.write_bytes(_encode_cmd(cmd))
+
+    def write_bytes(self, line: bytes) -> int:
+        """Queue an already encoded, newline-terminated command."""
+        self._buf += line
+        if len(self._buf) >= self.max_frame:
+            return self.flush()
+        return 0
+
+    def flush(self) -> int:
+        """Send all queued commands in one serial write."""
+        if not self._buf:
+            return 0
+        data = bytes(self._buf)
+        self._buf.clear()
+        return self.gpib._send(data)
+
+    def discard(self) -> None:
+        """Drop queued commands without sending them."""
+        self._buf.clear()
+
+    def query(self, cmd: str) -> bytes:
+        """Send queued commands plus cmd, then read the reply."""
+        with self.gpib.port_lock():
+            self.write(cmd)
+            self.flush()
+            return self.gpib._read_response()
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import Any
 
 try:  # pragma: no cover
     import requests  # type: ignore
@@ -10,6 +11,8 @@ except Exception:  # pragma: no cover
 
 
 class HttpDep(ABC):
+    __slots__ = ()
+
     @property
     @abstractmethod
     def is_open(self) -> bool: ...
@@ -30,26 +33,47 @@ class HttpDep(ABC):
     def close(self) -> None: ...
 
 
-@dataclass
+@dataclass(slots=True)
 class LocalHttpDep(HttpDep):
-    """Local HTTP dependency using requests library."""
+    """Local HTTP dependency using requests library.
+
+    Requests go through one requests.Session so keep-alive connections are
+    reused instead of opening a new TCP connection per call. The session is
+    created by the first request and dropped by close(); a request after
+    close() opens a new one.
+
+    is_open reports whether that session currently exists. It does not
+    check that the server is reachable.
+    """
 
     base_url: str
+    _session: Any = field(default=None, init=False, repr=False)
+
+    def _ensure(self):
+        if self._session is None:
+            if requests is None:  # pragma: no cover
+                raise RuntimeError("requests not available")
+            session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(pool_connections=8, pool_maxsize=32)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            self._session = session
+        return self._session
 
     @property
     def is_open(self) -> bool:
-        return True
+        """True while a Session exists (not a server reachability check)."""
+        return self._session is not None
 
     def _req(self, method: str, path: str, data: bytes | dict | None = None) -> bytes:
-        if requests is None:  # pragma: no cover
-            raise RuntimeError("requests not available")
+        session = self._ensure()
         url = f"{self.base_url}/{path.lstrip('/')}"
         if isinstance(data, bytes):
-            resp = requests.request(method, url, data=data)
+            resp = session.request(method, url, data=data)
         elif isinstance(data, dict):
-            resp = requests.request(method, url, json=data)
+            resp = session.request(method, url, json=data)
         else:
-            resp = requests.request(method, url)
+            resp = session.request(method, url)
         return resp.content
 
     def get(self, path: str) -> bytes:
@@ -65,4 +89,9 @@ class LocalHttpDep(HttpDep):
         return self._req("DELETE", path)
 
     def close(self) -> None:
-        return None
+        if self._session is not None:
+            try:
+                self._session.close()
+            except Exception:
+                pass
+            self._session = None
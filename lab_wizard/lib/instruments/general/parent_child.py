@@ -1,42 +1,37 @@
 from __future__ import annotations
 from abc import ABC, abstractmethod
-from typing import Any, TypeVar, Generic, Iterable, Set, Type, Self, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property, lru_cache
+from typing import Any, ClassVar, TypeVar, Generic, Iterable, Type, Self, Iterator
 import inspect
-from pydantic import BaseModel, model_validator
+from pydantic import BaseModel
 
 
 # Move base classes above TypeVar declarations so bounds use real types (not strings)
 class Dependency(ABC):
-    pass
+    __slots__ = ()
+
+    # True when independent calls may be issued from several threads at once
+    # (e.g. stateless HTTP requests). Shared serial/GPIB buses are not.
+    concurrent_safe: ClassVar[bool] = False
 
 
 # New common base for any instrument (parent, child, or hybrid)
 class Instrument(ABC):
-    pass
+    __slots__ = ()
 
 
 I_co = TypeVar("I_co", bound="Child[Any, Any]", covariant=True)
 P_co = TypeVar("P_co", bound="Parent[Any, Any]", covariant=True)
-E_co = TypeVar("E_co", bound="Instrument", covariant=True)
 
 
-class Params2Inst(Generic[E_co], ABC):
-    """
-    Mixin for parameter classes that can provide their corresponding instrument class.
-    The instrument instance may require resources not included in the params object,
-    such as a communication object from a parent instrument.
-    """
-
-    @property
-    @abstractmethod
-    def inst(self) -> type[E_co]: ...
-
-
-class CanInstantiate(Generic[P_co], ABC):
+class CanInstantiate(ABC, Generic[P_co]):
     """
     An instrument can be created with the params object. No other dependencies are required.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def create_inst(self) -> P_co:
         # this typically calls self.inst.from_params(self) or similar, possibly using internal deps
@@ -50,7 +45,7 @@ class CanInstantiate(Generic[P_co], ABC):
 # and I want
 
 
-class ChildParams(Instrument, BaseModel, Params2Inst[I_co], Generic[I_co]):
+class ChildParams(BaseModel, Generic[I_co]):
     """Base class for all child parameter objects.
 
     Generic over the concrete Child instrument type (I_co). This lets APIs
@@ -58,21 +53,56 @@ class ChildParams(Instrument, BaseModel, Params2Inst[I_co], Generic[I_co]):
     """
     enabled: bool = True
 
-    @model_validator(mode="after")
-    def validate_type_exists(self) -> Self:
-        """Ensure a 'type' discriminator exists (required for union discrimination)."""
-        if not hasattr(self, "type") or getattr(self, "type") is None:
-            raise ValueError("Missing required 'type' field")
-        return self
+    # 'type' discriminator -> concrete ChildParams subclass, filled in as
+    # instrument modules are imported (see __pydantic_init_subclass__).
+    _TYPE_REGISTRY: ClassVar[dict[str, type[ChildParams[Any]]]] = {}
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        super().__pydantic_init_subclass__(**kwargs)
+        # Skip generic parametrizations such as ChildParams["Sim970"]
+        if cls.__pydantic_generic_metadata__["origin"] is not None:
+            return
+        field = cls.model_fields.get("type")
+        if field is None:
+            # Checked once per class rather than by a validator on every
+            # instance; the 'type' discriminator is needed for union parsing.
+            if not inspect.isabstract(cls):
+                raise TypeError(f"{cls.__name__} must declare a 'type' literal field")
+            return
+        if isinstance(field.default, str):
+            registry = ChildParams._TYPE_REGISTRY
+            existing = registry.get(field.default)
+            # A module re-import redefines the same class; anything else
+            # claiming a taken 'type' would make the discriminator ambiguous.
+            if existing is not None and (existing.__module__, existing.__qualname__) != (
+                cls.__module__,
+                cls.__qualname__,
+            ):
+                raise TypeError(
+                    f"{cls.__name__}: type {field.default!r} is already registered "
+                    f"by {existing.__module__}.{existing.__qualname__}"
+                )
+            registry[field.default] = cls
+
+    @staticmethod
+    def registered_type(type_str: str) -> type[ChildParams[Any]] | None:
+        """Return the already-imported ChildParams subclass for a type string."""
+        return ChildParams._TYPE_REGISTRY.get(type_str)
+
+    @classmethod
+    def from_trusted(cls, **data: Any) -> Self:
+        """Build an instance from already-validated values without re-validating.
+
+        Uses model_construct: field defaults are applied but no validators
+        run, so only pass values that came from a validated model.
+        """
+        return cls.model_construct(**data)
 
     @property
     @abstractmethod
-    def inst(self) -> type[I_co]: ...
-
-    """
-    This needs to be here even though a very similar property exist in Params2Inst. The key is that
-    here we're specifying that .inst doesn't just return an Instrument, it returns specifically a Child
-    """
+    def inst(self) -> type[I_co]:
+        """The Child instrument class these params create."""
 
 
 R = TypeVar("R", bound=Dependency)
@@ -82,7 +112,7 @@ P = TypeVar("P", bound=ChildParams[Any])
 PR_co = TypeVar("PR_co", bound="Parent[Any, Any]")
 
 
-class ParentParams(BaseModel, Params2Inst[PR_co], Generic[PR_co, R, P]):
+class ParentParams(BaseModel, Generic[PR_co, R, P]):
     """
 
     PR_co: Corresponding Parent instrument type
@@ -94,9 +124,19 @@ class ParentParams(BaseModel, Params2Inst[PR_co], Generic[PR_co, R, P]):
     """
     enabled: bool = True
 
+    @classmethod
+    def from_trusted(cls, **data: Any) -> Self:
+        """Build an instance from already-validated values without re-validating.
+
+        Uses model_construct: field defaults are applied but no validators
+        run, so only pass values that came from a validated model.
+        """
+        return cls.model_construct(**data)
+
     @property
     @abstractmethod
-    def inst(self) -> type[PR_co]: ...
+    def inst(self) -> type[PR_co]:
+        """The Parent instrument class these params create."""
 
 
 class Parent(Instrument, ABC, Generic[R, P]):
@@ -111,6 +151,8 @@ class Parent(Instrument, ABC, Generic[R, P]):
       implement the Child.from_params(dep, params) factory.
     """
 
+    __slots__ = ()
+
     children: dict[str, "Child[R, P]"]
 
     @property
@@ -153,6 +195,28 @@ class Parent(Instrument, ABC, Generic[R, P]):
         """
         pass
 
+    def get_child(self, key: str) -> "Child[R, P] | None":
+        """Return the child stored under key, or None."""
+        return self.children.get(key)
+
+    def measure_all(self) -> dict[str, Any]:
+        """Call measure() on every child that provides one, keyed by child key.
+
+        Children share this parent's dep. If the dep is concurrent_safe the
+        calls are overlapped on a thread pool, so the total time is roughly
+        the slowest child rather than the sum. Otherwise they run in order.
+        """
+        targets = {
+            key: measure
+            for key, child in self.children.items()
+            if callable(measure := getattr(child, "measure", None))
+        }
+        if len(targets) > 1 and self.dep.concurrent_safe:
+            with ThreadPoolExecutor(max_workers=len(targets)) as ex:
+                futures = {key: ex.submit(fn) for key, fn in targets.items()}
+                return {key: f.result() for key, f in futures.items()}
+        return {key: fn() for key, fn in targets.items()}
+
 
 PP = TypeVar(
     "PP", bound=ParentParams[Any, Any, Any]
@@ -171,6 +235,8 @@ class ParentFactory(ABC, Generic[PP, PR]):
       Accepts a params instance (PP) and returns (parent_instance, same_params_object).
     """
 
+    __slots__ = ()
+
     @classmethod
     @abstractmethod
     def from_params(cls, params: PP) -> PR:
@@ -180,18 +246,25 @@ class ParentFactory(ABC, Generic[PP, PR]):
 # ------------------- Params / __init__ alignment utilities -------------------
 
 
-def _collect_init_param_names(cls: type) -> Set[str]:
+@lru_cache(maxsize=None)
+def _collect_init_param_names(cls: type) -> frozenset[str]:
     """Return the set of parameter names (excluding self) in the class __init__.
 
     Considers POSITIONAL_OR_KEYWORD and KEYWORD_ONLY parameters. Ignores *args/**kwargs
-    because those defeat strict alignment guarantees.
+    because those defeat strict alignment guarantees. Cached per class.
     """
     sig = inspect.signature(cls.__init__)
-    names: Set[str] = set()
-    for p in list(sig.parameters.values())[1:]:  # skip self
-        if p.kind in (p.POSITIONAL_OR_KEYWORD, p.KEYWORD_ONLY):
-            names.add(p.name)
-    return names
+    return frozenset(
+        p.name
+        for p in list(sig.parameters.values())[1:]  # skip self
+        if p.kind in (p.POSITIONAL_OR_KEYWORD, p.KEYWORD_ONLY)
+    )
+
+
+@lru_cache(maxsize=None)
+def _model_field_set(params_cls: type[BaseModel], exclude: frozenset[str]) -> frozenset[str]:
+    """Return params_cls's field names minus exclude. Cached per (class, exclude)."""
+    return frozenset(params_cls.model_fields) - exclude
 
 
 def assert_params_init_alignment(
@@ -210,7 +283,7 @@ def assert_params_init_alignment(
     Raises TypeError on mismatch for early (import-time) failure.
     """
     init_names = _collect_init_param_names(parent_cls)
-    model_fields = set(params_cls.model_fields) - set(exclude)
+    model_fields = _model_field_set(params_cls, frozenset(exclude))
     missing = model_fields - init_names
     extra = init_names - model_fields
     problems: list[str] = []
@@ -243,6 +316,8 @@ class Child(Instrument, ABC, Generic[R, P_child]):
     precise return typing while remaining friendly to static type checkers.
     """
 
+    __slots__ = ()
+
     @property
     @abstractmethod
     def parent_class(self) -> str:
@@ -277,21 +352,30 @@ class ChannelProvider(ABC, Generic[ChanT]):
     interface for higher-level code (measurement orchestration, UI, etc.).
     """
 
+    __slots__ = ()
+
     # Subclasses must set: self.channels: list[ChanT]
     channels: list[ChanT]
 
-    @property
+    @cached_property
     def num_channels(self) -> int:
+        # channels is fixed once built, so compute this on first access only
         return len(self.channels)
 
     def get_channel(self, index: int) -> ChanT:
-        if index < 0 or index >= len(self.channels):
-            raise IndexError(
-                f"Channel index {index} out of range (0..{len(self.channels)-1})"
-            )
-        return self.channels[index]
+        # Let the list do the upper bound check; only negative (from-the-end)
+        # indices need rejecting up front.
+        if index >= 0:
+            try:
+                return self.channels[index]
+            except IndexError:
+                pass
+        raise IndexError(
+            f"Channel index {index} out of range (0..{len(self.channels)-1})"
+        )
 
     def __getitem__(self, index: int) -> ChanT:  # allows obj[index]
+        # Dispatches through get_channel so subclass overrides apply
         return self.get_channel(index)
 
     def __iter__(self) -> Iterator[ChanT]:
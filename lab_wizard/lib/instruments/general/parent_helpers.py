@@ -5,13 +5,29 @@ These functions provide reusable implementations for common Parent method patter
 reducing code duplication across instrument modules.
 """
 
-from typing import TypeVar, cast, TYPE_CHECKING, Any
+from typing import Callable, TypeVar, TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     from lab_wizard.lib.instruments.general.parent_child import Parent, Child, ChildParams
 
 TChild = TypeVar("TChild", bound="Child[Any, Any]")
 
+# ChildParams subclass -> its Child's from_params_with_dep, filled on first use
+_FACTORIES: dict[type, Callable[..., Any]] = {}
+
+
+def child_factory(params: "ChildParams[Any]") -> Callable[..., Any]:
+    """
+    Return params.inst.from_params_with_dep, cached per params class.
+
+    Every ChildParams subclass's inst property returns a fixed class, so the
+    property and classmethod lookups only need doing once per type.
+    """
+    factory = _FACTORIES.get(type(params))
+    if factory is None:
+        factory = _FACTORIES[type(params)] = params.inst.from_params_with_dep
+    return factory
+
 
 def standard_add_child(parent: "Parent[Any, Any]", params: "ChildParams[Any]", key: str) -> "Child[Any, Any]":
     """
@@ -24,9 +40,8 @@ def standard_add_child(parent: "Parent[Any, Any]", params: "ChildParams[Any]", k
     ```
     """
     parent.params.children[key] = params  # type: ignore[assignment, attr-defined]
-    child_cls = params.inst
-    child = child_cls.from_params_with_dep(parent.dep, key, params)
-    parent.children[key] = cast("Child[Any, Any]", child)
+    child = child_factory(params)(parent.dep, key, params)
+    parent.children[key] = child
     return child
 
 
@@ -40,7 +55,7 @@ def standard_init_children(parent: "Parent[Any, Any]") -> None:
         standard_init_children(self)
     ```
     """
-    for key in list(parent.params.children.keys()):  # type: ignore[attr-defined]
+    for key in parent.params.children:  # type: ignore[attr-defined]
         parent.init_child_by_key(key)
 
 
@@ -55,7 +70,6 @@ def standard_init_child_by_key(parent: "Parent[Any, Any]", key: str) -> "Child[A
     ```
     """
     params = parent.params.children[key]  # type: ignore[attr-defined]
-    child_cls = params.inst
-    child = child_cls.from_params_with_dep(parent.dep, key, params)
+    child = child_factory(params)(parent.dep, key, params)
     parent.children[key] = child
     return child
\ No newline at end of file
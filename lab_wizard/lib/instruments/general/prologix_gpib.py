@@ -1,7 +1,8 @@
 from __future__ import annotations
 
-from typing import Annotated, TypeVar, cast, Any, Literal
-from pydantic import Field, model_validator
+import sys
+from typing import Annotated, TypeVar, Any, Literal, get_args
+from pydantic import Field
 
 from lab_wizard.lib.instruments.sim900.sim900 import Sim900Params
 from lab_wizard.lib.instruments.general.parent_child import (
@@ -12,16 +13,47 @@ from lab_wizard.lib.instruments.general.parent_child import (
     ChildParams,
     CanInstantiate,
 )
+from lab_wizard.lib.instruments.general.parent_helpers import child_factory
 from lab_wizard.lib.instruments.general.serial import SerialDep, LocalSerialDep
 
 # TypeVar for method-level inference
 TChild = TypeVar("TChild", bound=Child[SerialDep, Any])
 
 
+# GPIB primary addresses are 0-30
+NUM_GPIB_ADDRS = 31
+# Interned child keys for each address, shared by every PrologixGPIB
+_ADDR_KEYS: tuple[str, ...] = tuple(sys.intern(str(i)) for i in range(NUM_GPIB_ADDRS))
+# Reverse map; only these canonical spellings ("5", not "05") are addresses
+_ADDR_OF_KEY: dict[str, int] = {key: addr for addr, key in enumerate(_ADDR_KEYS)}
+
+
 # Union of possible child param types on a serial bus (extend as needed)
 PrologixChildParams = Annotated[Sim900Params, Field(discriminator="type")]
 
 
+# PrologixChildParams members (a single class or a union) by 'type' value
+_child_union = get_args(PrologixChildParams)[0]
+_CHILD_PARAMS_BY_TYPE: dict[str, type[ChildParams[Any]]] = {
+    cls.model_fields["type"].default: cls for cls in get_args(_child_union) or (_child_union,)
+}
+
+
+def _child_params_from_dict(data: dict[str, Any]) -> ChildParams[Any]:
+    """Validate a raw child params dict against the class its 'type' names.
+
+    Only members of PrologixChildParams are accepted; the class is looked up
+    directly instead of running the discriminated union.
+    """
+    cls = _CHILD_PARAMS_BY_TYPE.get(data.get("type", ""))
+    if cls is None:
+        raise ValueError(
+            f"Unsupported child type for PrologixGPIB: {data.get('type')!r}"
+            f" (expected one of {sorted(_CHILD_PARAMS_BY_TYPE)})"
+        )
+    return cls.model_validate(data)
+
+
 class PrologixGPIBParams(
     ParentParams["PrologixGPIB", SerialDep, PrologixChildParams],
     CanInstantiate["PrologixGPIB"],
@@ -38,10 +70,6 @@ class PrologixGPIBParams(
     timeout: int = 1
     children: dict[str, PrologixChildParams] = Field(default_factory=dict)
 
-    @model_validator(mode="after")
-    def _validate(self):
-        return self
-
     @property
     def inst(self) -> type["PrologixGPIB"]:  # type: ignore[override]
         return PrologixGPIB
@@ -62,10 +90,14 @@ class PrologixGPIB(
     Children (e.g., Sim900) receive the shared SerialDep serial connection.
     """
 
+    __slots__ = ("params", "_dep", "children", "_children_by_addr")
+
     def __init__(self, serial_dep: SerialDep, params: PrologixGPIBParams):
         self.params = params
         self._dep = serial_dep
         self.children: dict[str, Child[SerialDep, Any]] = {}
+        # Children whose key is a GPIB address, indexed by that address
+        self._children_by_addr: list[Child[SerialDep, Any] | None] = [None] * NUM_GPIB_ADDRS
 
     @property
     def dep(self) -> SerialDep:
@@ -84,33 +116,78 @@ class PrologixGPIB(
         except Exception:
             pass
 
+    def __enter__(self) -> "PrologixGPIB":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.disconnect()
+
+    def _store_child(self, key: str, child: Child[SerialDep, Any]) -> None:
+        """Record child under key, and under its GPIB address if key is one."""
+        self.children[key] = child
+        addr = _ADDR_OF_KEY.get(key)
+        if addr is not None:
+            self._children_by_addr[addr] = child
+
     def init_child_by_key(self, key: str) -> Child[SerialDep, Any]:
+        key = sys.intern(key)
         child_params = self.params.children[key]
-        child_cls = child_params.inst
-        child = child_cls.from_params_with_dep(self.dep, key, child_params)
-        self.children[key] = child
+        child = child_factory(child_params)(self.dep, key, child_params)
+        self._store_child(key, child)
         return child
 
     def init_children(self) -> None:
-        for key in list(self.params.children.keys()):
-            self.init_child_by_key(key)
-
-    def add_child(self, params: ChildParams[TChild], key: str) -> TChild:
+        # Same as init_child_by_key for each key, without re-looking up the
+        # params and dep per child. Setup commands the children send are
+        # coalesced into as few serial writes as possible.
+        dep = self._dep
+        store = self._store_child
+        with dep.batched():
+            for key, child_params in self.params.children.items():
+                key = sys.intern(key)
+                store(key, child_factory(child_params)(dep, key, child_params))
+
+    def add_child(
+        self, params: ChildParams[TChild] | dict[str, Any], key: str | int
+    ) -> TChild:
+        """Add a child from its params, or from a raw params dict with a 'type' key.
+
+        key may also be given as an int GPIB address.
+        """
+        if isinstance(params, dict):
+            params = _child_params_from_dict(params)
+        key = self.child_key(key) if type(key) is int else sys.intern(key)  # type: ignore[arg-type]
+        child = child_factory(params)(self.dep, key, params)
+        # Record the params only once the child was actually built
         self.params.children[key] = params  # type: ignore[assignment]
-        child_cls = params.inst
-        child = child_cls.from_params_with_dep(self.dep, key, params)
-        self.children[key] = cast(Child[SerialDep, Any], child)
+        self._store_child(key, child)
         return child
 
-    def get_child(self, key: str) -> Child[SerialDep, Any] | None:
-        return self.children.get(key)
+    def get_child(self, key: str | int) -> Child[SerialDep, Any] | None:
+        if type(key) is int:
+            if 0 <= key < NUM_GPIB_ADDRS:  # type: ignore[operator]
+                return self._children_by_addr[key]  # type: ignore[index]
+            return None
+        return self.children.get(key)  # type: ignore[arg-type]
+
+    @staticmethod
+    def child_key(addr: int) -> str:
+        """Return the (interned) children key for GPIB address addr."""
+        if not 0 <= addr < NUM_GPIB_ADDRS:
+            raise ValueError(f"GPIB address must be 0-{NUM_GPIB_ADDRS - 1}, got {addr}")
+        return _ADDR_KEYS[addr]
+
+    def get_child_fast(self, addr: int) -> Child[SerialDep, Any] | None:
+        """Return the child keyed by GPIB address addr, skipping the str lookup."""
+        return self._children_by_addr[addr]
 
     def list_children(self):
-        print(f"Prologix Connection ({self.params.port}) Children:")
-        print("=" * 50)
-        for name, child in self.children.items():
-            print(f"{name}: {child}")
-        print("=" * 50)
+        # One print, so stdout sees a single write rather than one per line
+        rule = "=" * 50
+        lines = [f"Prologix Connection ({self.params.port}) Children:", rule]
+        lines += [f"{name}: {child}" for name, child in self.children.items()]
+        lines.append(rule)
+        print("\n".join(lines))
 
 
 if __name__ == "__main__":
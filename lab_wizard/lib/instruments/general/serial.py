@@ -1,8 +1,16 @@
 from __future__ import annotations
 
+import logging
+import os
+import select
+import threading
+import time
+import weakref
 from abc import ABC, abstractmethod
+from collections import deque
+from contextlib import contextmanager
 from dataclasses import dataclass, field
-from typing import Optional, Any
+from typing import Iterator, Optional, Any, Self
 
 from lab_wizard.lib.instruments.general.parent_child import Dependency
 
@@ -11,12 +19,52 @@ try:
 except Exception:  # pragma: no cover - tests patch serial anyway
     pyserial = None  # type: ignore
 
+logger = logging.getLogger(__name__)
+
+
+def _close_port(ser: Any) -> None:
+    """weakref.finalize callback: close a port its dep forgot to close."""
+    if getattr(ser, "is_open", False):
+        ser.close()
+
+
+def set_low_latency(ser: Any) -> bool:
+    """Ask the driver of an open pyserial port to deliver bytes immediately.
+
+    USB-serial adapters (FTDI, CH340, ...) otherwise hold received bytes for
+    their latency timer (typically 16 ms) before handing them to the host,
+    which dominates the round trip of a short query. Uses pyserial's
+    ASYNC_LOW_LATENCY ioctl where available and falls back to the sysfs
+    latency_timer of usb-serial devices. Returns True if either worked.
+    """
+    set_mode = getattr(ser, "set_low_latency_mode", None)
+    if set_mode is not None:
+        try:
+            set_mode(True)
+            return True
+        except Exception as e:
+            # e.g. OSError from the ioctl, or TypeError when there is no fd
+            logger.debug("ASYNC_LOW_LATENCY not set on %s: %s", getattr(ser, "port", ser), e)
+    port = getattr(ser, "port", None)
+    if not isinstance(port, str):
+        return False
+    name = os.path.basename(os.path.realpath(port))
+    try:
+        with open(f"/sys/bus/usb-serial/devices/{name}/latency_timer", "w") as f:
+            f.write("1")
+        return True
+    except OSError as e:
+        logger.debug("latency_timer not set for %s: %s", port, e)
+        return False
+
 
 def _ensure_bytes(data: bytes | str) -> bytes:
     """Convert str to bytes if needed."""
-    if isinstance(data, bytes):
+    if type(data) is bytes:
         return data
-    return data.encode()
+    if isinstance(data, str):
+        return data.encode()
+    return bytes(data)
 
 
 class SerialDep(Dependency, ABC):
@@ -25,6 +73,8 @@ class SerialDep(Dependency, ABC):
     Concrete implementation: LocalSerialDep
     """
 
+    __slots__ = ()
+
     @property
     @abstractmethod
     def is_open(self) -> bool:  # pragma: no cover - interface
@@ -39,22 +89,71 @@ class SerialDep(Dependency, ABC):
     @abstractmethod
     def readline(self) -> bytes: ...
 
-    def query(self, cmd: str) -> bytes:
+    def query(self, cmd: bytes | str) -> bytes:
         self.write(cmd)
         return self.readline()
 
+    @contextmanager
+    def batched(self) -> Iterator[None]:
+        """Group writes made inside the block; unbuffered by default."""
+        yield
+
     @abstractmethod
     def close(self) -> None: ...
 
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
 
-@dataclass
+@dataclass(slots=True, weakref_slot=True)
 class LocalSerialDep(SerialDep):
-    """Local serial port dependency using pyserial."""
+    """Local serial port dependency using pyserial.
+
+    One port is typically shared by several instruments (e.g. every GPIB
+    device behind a Prologix adapter), so each I/O call, and query() as a
+    whole, runs under a re-entrant lock.
+
+    Close it explicitly (or use it as a context manager). A port left open
+    is closed by a weakref.finalize once the dep is garbage collected or at
+    interpreter exit.
+    """
 
     port: str
     baudrate: int = 9600
     timeout: float = 1.0
+    # Request low-latency mode from the USB-serial driver when the port opens
+    # (see set_low_latency); low_latency_active records whether it took.
+    low_latency: bool = True
+    low_latency_active: bool = field(default=False, init=False, compare=False)
+    # Write straight to the port's file descriptor with os.write instead of
+    # through pyserial (see _write_port). Falls back if there is no fd.
+    raw_writes: bool = False
     _serial: Any = field(default=None, init=False, repr=False)
+    # Set when _ensure() opens the port and cleared by close()
+    _opened: bool = field(default=False, init=False, repr=False, compare=False)
+    _fd: int | None = field(default=None, init=False, repr=False, compare=False)
+    _lock: Any = field(
+        default_factory=threading.RLock, init=False, repr=False, compare=False
+    )
+    # GPIB address currently selected on an adapter (e.g. Prologix) behind
+    # this port, so GPIBComm can skip re-sending an unchanged ++addr.
+    gpib_addr: int | None = field(default=None, init=False, repr=False, compare=False)
+    # Optional background reader (see start_reader); None when reads go
+    # straight to the port.
+    _reader: Any = field(default=None, init=False, repr=False, compare=False)
+    _reader_stop: Any = field(default=None, init=False, repr=False, compare=False)
+    _rx_queue: Any = field(default=None, init=False, repr=False, compare=False)
+    _rx_ready: Any = field(default=None, init=False, repr=False, compare=False)
+    # Received bytes not yet returned to a caller (e.g. past a readline's
+    # newline), served before anything new from the port or queue.
+    _rx_pending: bytearray = field(
+        default_factory=bytearray, init=False, repr=False, compare=False
+    )
+    # Writes queued inside batched(); None outside a batch.
+    _tx_buf: bytearray | None = field(default=None, init=False, repr=False, compare=False)
 
     def _ensure(self) -> Any:
         if self._serial is None:
@@ -63,21 +162,107 @@ class LocalSerialDep(SerialDep):
             self._serial = pyserial.Serial(
                 port=self.port, baudrate=self.baudrate, timeout=self.timeout
             )
+            if self.low_latency:
+                self.low_latency_active = set_low_latency(self._serial)
+            self._opened = True
+            weakref.finalize(self, _close_port, self._serial)
+            if self.raw_writes:
+                try:
+                    self._fd = self._serial.fileno()
+                except Exception as e:
+                    logger.debug("No fd for raw writes on %s: %s", self.port, e)
         return self._serial
 
     @property
     def is_open(self) -> bool:
-        return bool(self._serial and getattr(self._serial, "is_open", False))
+        # Also consult pyserial, which notices a port closed underneath us
+        return self._opened and bool(self._serial.is_open)
+
+    @property
+    def lock(self) -> Any:
+        """Re-entrant lock guarding this port, for multi-step exchanges."""
+        return self._lock
 
     def write(self, data: bytes | str) -> int:
+        with self._lock:
+            data = _ensure_bytes(data)
+            if self._tx_buf is not None:
+                self._tx_buf += data
+                return len(data)
+            return self._write_port(data)
+
+    def _write_port(self, data: bytes) -> int:
         ser = self._ensure()
-        try:
-            ser.flush()
-        except Exception:  # pragma: no cover
-            pass
-        return ser.write(_ensure_bytes(data))  # type: ignore[no-any-return]
+        fd = self._fd
+        if fd is None:
+            return ser.write(data)  # type: ignore[no-any-return]
+        # pyserial opens the fd non-blocking; wait for room when it is full.
+        # os.write releases the GIL and skips pyserial's Python-level loop.
+        view = memoryview(data)
+        while view:
+            try:
+                view = view[os.write(fd, view) :]
+            except BlockingIOError:
+                if not select.select((), (fd,), (), self.timeout)[1]:
+                    raise TimeoutError(f"Write timeout on {self.port}") from None
+        return len(data)
+
+    def flush(self) -> None:
+        """Send writes queued by batched() now."""
+        with self._lock:
+            buf = self._tx_buf
+            if buf:
+                data = bytes(buf)
+                buf.clear()
+                try:
+                    self._write_port(data)
+                except BaseException:
+                    # A queued ++addr may not have reached the adapter
+                    self.gpib_addr = None
+                    raise
+
+    @contextmanager
+    def batched(self) -> Iterator[None]:
+        """Queue writes made inside the block and send them as one write.
+
+        Holds the port lock for the whole block, so other threads' traffic
+        cannot interleave. Queued bytes go out on exit, or before any read
+        inside the block so a query still gets its reply. Nested blocks join
+        the outer one. If the block raises, unsent writes are dropped (and
+        gpib_addr is forgotten, since they may have included an ++addr).
+        """
+        with self._lock:
+            if self._tx_buf is not None:
+                yield
+                return
+            self._tx_buf = bytearray()
+            try:
+                yield
+            except BaseException:
+                self._tx_buf = None
+                self.gpib_addr = None
+                raise
+            try:
+                self.flush()
+            finally:
+                self._tx_buf = None
 
     def read(self, size: Optional[int] = None) -> bytes:
+        with self._lock:
+            if self._tx_buf:
+                self.flush()
+            if self._reader is not None:
+                return self._read_queued(size)
+            return self._read(size)
+
+    def _read(self, size: Optional[int]) -> bytes:
+        pending = self._rx_pending
+        if pending:
+            # Bytes left over from a previous readline() come first
+            if size is not None and len(pending) >= size:
+                return self._take(size)
+            head = self._take(len(pending))
+            return head + self._read(None if size is None else size - len(head))
         ser = self._ensure()
         if size is None:
             try:
@@ -87,8 +272,155 @@ class LocalSerialDep(SerialDep):
         return ser.read(size)
 
     def readline(self) -> bytes:
-        return self._ensure().readline()
+        with self._lock:
+            if self._tx_buf:
+                self.flush()
+            if self._reader is not None:
+                return self._readline_queued()
+            return self._readline()
+
+    def _readline(self) -> bytes:
+        # pyserial's readline() issues one read(1) per byte. Read whatever
+        # the driver already holds instead, and keep any bytes past the
+        # newline in _rx_pending for the next call.
+        ser = self._ensure()
+        pending = self._rx_pending
+        while True:
+            idx = pending.find(b"\n")
+            if idx >= 0:
+                return self._take(idx + 1)
+            chunk = ser.read(getattr(ser, "in_waiting", 0) or 1)
+            if not chunk:  # timed out
+                return self._take(len(pending))
+            pending += chunk
+
+    # ---- Background reader (opt-in) ----
+
+    def start_reader(self, max_chunks: int = 4096) -> None:
+        """Drain the port on a background thread into a bounded buffer.
+
+        While running, read()/readline() are served from what the thread has
+        already received, so incoming bytes are collected while the caller
+        is busy (e.g. writing the next command) instead of only when it
+        blocks on a read. Stopped by stop_reader() or close().
+
+        Received chunks go into a deque (append/popleft are atomic, so the
+        thread takes no lock). At most max_chunks unread chunks are kept;
+        beyond that the oldest are dropped and a warning is logged, since
+        replies read after that point may be truncated.
+        """
+        with self._lock:
+            if self._reader is not None:
+                return
+            ser = self._ensure()
+            self._rx_queue = deque(maxlen=max_chunks)
+            self._rx_ready = threading.Event()
+            self._reader_stop = threading.Event()
+            self._reader = threading.Thread(
+                target=self._reader_loop,
+                args=(ser, self._rx_queue, self._rx_ready, self._reader_stop),
+                name=f"serial-reader-{self.port}",
+                daemon=True,
+            )
+            self._reader.start()
+
+    def stop_reader(self) -> None:
+        """Stop the background reader; unread buffered data is discarded."""
+        with self._lock:
+            reader = self._reader
+            if reader is None:
+                return
+            self._reader_stop.set()
+            reader.join(timeout=self.timeout + 1.0)
+            self._reader = None
+            self._reader_stop = None
+            self._rx_queue = None
+            self._rx_ready = None
+            self._rx_pending.clear()
+
+    @staticmethod
+    def _reader_loop(
+        ser: Any, rx: "deque[bytes]", ready: threading.Event, stop: threading.Event
+    ) -> None:
+        maxlen = rx.maxlen
+        overflowing = False
+        while not stop.is_set():
+            try:
+                data = ser.read(getattr(ser, "in_waiting", 0) or 1)
+            except Exception:
+                break
+            if data:
+                if maxlen is not None and len(rx) >= maxlen:
+                    if not overflowing:
+                        logger.warning(
+                            "Serial reader buffer full on %s; dropping oldest received data",
+                            getattr(ser, "port", ser),
+                        )
+                        overflowing = True
+                else:
+                    overflowing = False
+                rx.append(data)
+                ready.set()
+            else:
+                stop.wait(0.001)
+
+    def _pull(self, deadline: float | None) -> bool:
+        """Move one received chunk into _rx_pending; False if none arrived."""
+        rx = self._rx_queue
+        ready = self._rx_ready
+        while True:
+            try:
+                chunk = rx.popleft()
+                break
+            except IndexError:
+                pass
+            if deadline is None:
+                return False
+            # Clear then re-check so an append racing with clear() is seen
+            ready.clear()
+            if rx:
+                continue
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not ready.wait(remaining):
+                return False
+        self._rx_pending += chunk
+        return True
+
+    def _take(self, n: int) -> bytes:
+        pending = self._rx_pending
+        out = bytes(pending[:n])
+        del pending[:n]
+        return out
+
+    def _read_queued(self, size: Optional[int]) -> bytes:
+        if size is None:
+            while self._pull(None):
+                pass
+            return self._take(len(self._rx_pending))
+        deadline = time.monotonic() + self.timeout
+        while len(self._rx_pending) < size and self._pull(deadline):
+            pass
+        return self._take(size)
+
+    def _readline_queued(self) -> bytes:
+        deadline = time.monotonic() + self.timeout
+        while True:
+            idx = self._rx_pending.find(b"\n")
+            if idx >= 0:
+                return self._take(idx + 1)
+            if not self._pull(deadline):
+                return self._take(len(self._rx_pending))
+
+    def query(self, cmd: bytes | str) -> bytes:
+        with self._lock:
+            self.write(cmd)
+            return self.readline()
 
     def close(self) -> None:
-        if self._serial and getattr(self._serial, "is_open", False):
-            self._serial.close()
+        with self._lock:
+            self.stop_reader()
+            self.gpib_addr = None
+            self._fd = None
+            if self._opened:
+                self._opened = False
+                self._serial.close()
@@ -4,8 +4,24 @@ serialInst.py - General utility classes for serial instruments
 Based on the original serialInst.py from the SNSPD library but cleaned up for the new structure.
 """
 
+import logging
 import serial
-import time
+
+from lab_wizard.lib.instruments.general.serial import set_low_latency
+
+logger = logging.getLogger(__name__)
+
+# GPIB address last selected with ++addr on each port, shared by every
+# GPIBmodule talking to an adapter on that port
+_selected_addr: dict[str, int] = {}
+
+
+def _offline_write(data: bytes) -> bool:
+    return True
+
+
+def _offline_readline() -> str:
+    return ""
 
 
 class serialInst:
@@ -14,13 +30,19 @@ class serialInst:
     """
 
     def __init__(
-        self, port: str, timeout: int = 1, offline: bool = False, baudrate: int = 9600
+        self,
+        port: str,
+        timeout: int = 1,
+        offline: bool = False,
+        baudrate: int = 9600,
+        low_latency: bool = True,
     ):
         """
         :param port: The serial port
         :param timeout: the serial timeout
         :param offline: For testing purposes when your computer is not connected to the instrument
         :param baudrate: Serial communication baud rate
+        :param low_latency: Ask the USB-serial driver to skip its latency timer on connect
         """
         self.serial = serial.Serial()
         self.timeout = timeout
@@ -29,31 +51,64 @@ class serialInst:
         self.serial.timeout = timeout
         self.serial.baudrate = baudrate
         self.offline = offline
+        self.low_latency = low_latency
+        # I/O entry points chosen once here, so read()/write() don't re-check
+        # offline. Bound methods stay valid across open()/close().
+        if offline:
+            self._write = _offline_write
+            self._readline = _offline_readline
+        else:
+            self._write = self.serial.write
+            self._readline = self._buffered_readline
+        # Bytes received past the last line returned by read()
+        self._rx = bytearray()
 
     def connect(self) -> bool | None:
         if self.offline:
-            print(f"Connected to offline instrument {self.__class__}")
+            logger.debug("Connected to offline instrument %s", self.__class__)
             return True
-        return self.serial.open()
+        result = self.serial.open()
+        if self.low_latency:
+            # Same best-effort helper LocalSerialDep uses; never raises
+            set_low_latency(self.serial)
+        return result
 
     def disconnect(self) -> bool | None:
         if self.offline:
-            print(f"Disconnected from offline instrument {self.__class__}")
+            logger.debug("Disconnected from offline instrument %s", self.__class__)
             return True
         return self.serial.close()
 
     def read(self) -> str | bytes:
-        if self.offline:
-            return ""
-        return self.serial.readline()
+        return self._readline()
+
+    def _buffered_readline(self) -> bytes:
+        # pyserial's readline()/read_until() read one byte per call; take
+        # everything the driver already holds instead and split lines here.
+        ser = self.serial
+        rx = self._rx
+        while True:
+            idx = rx.find(b"\n")
+            if idx >= 0:
+                line = bytes(rx[: idx + 1])
+                del rx[: idx + 1]
+                return line
+            chunk = ser.read(ser.in_waiting or 1)
+            if not chunk:  # timed out
+                line = bytes(rx)
+                rx.clear()
+                return line
+            rx += chunk
 
     def write(self, cmd: str) -> int | bool:
-        if self.offline:
-            return True
-        self.serial.flush()
-        result = self.serial.write(cmd.encode())
+        result = self._write(cmd.encode())
         return result if result is not None else 0
 
+    def drain(self) -> None:
+        """Block until everything written has left the port (tcdrain)."""
+        if not self.offline:
+            self.serial.flush()
+
     def query(self, cmd: str) -> str | bytes:
         self.write(cmd)
         return self.read()
@@ -82,6 +137,14 @@ class GPIBmodule(serialInst):
         super().__init__(port, timeout, offline, baudrate)
         self.gpibAddr = gpibAddr
 
+    def connect(self) -> bool | None:
+        _selected_addr.pop(self.port, None)
+        return super().connect()
+
+    def disconnect(self) -> bool | None:
+        _selected_addr.pop(self.port, None)
+        return super().disconnect()
+
     def write(self, cmd: str) -> int | bool:
         """
         Write command with GPIB addressing
@@ -89,14 +152,19 @@ class GPIBmodule(serialInst):
         if self.offline:
             return True
 
-        # Format command for GPIB
-        gpib_cmd = f"++addr {self.gpibAddr}\n{cmd}\n"
-        return super().write(gpib_cmd)
+        # Format command for GPIB, re-selecting the address only when another
+        # module on this port selected a different one since our last write
+        if _selected_addr.get(self.port) == self.gpibAddr:
+            return super().write(f"{cmd}\n")
+        result = super().write(f"++addr {self.gpibAddr}\n{cmd}\n")
+        _selected_addr[self.port] = self.gpibAddr
+        return result
 
     def query(self, cmd: str) -> str | bytes:
         """
         Query with GPIB addressing
         """
+        # read() blocks until a full line arrives or the serial timeout
+        # expires, so there is no need to sleep before it
         self.write(cmd)
-        time.sleep(0.1)  # Small delay for response
         return self.read()
@@ -12,6 +12,9 @@ except Exception:  # pragma: no cover
 
 def _coerce_str(payload: Any) -> str:
     """Normalize payload to string."""
+    # pyvisa read() already returns str; check the exact type first.
+    if type(payload) is str:
+        return payload
     if isinstance(payload, bytes):
         return payload.decode("utf-8", errors="replace")
     return str(payload)
@@ -19,14 +22,18 @@ def _coerce_str(payload: Any) -> str:
 
 def _coerce_bytes(payload: Any) -> bytes:
     """Normalize payload to bytes."""
-    if isinstance(payload, bytes):
+    if type(payload) is bytes:
         return payload
+    if isinstance(payload, (bytes, bytearray, memoryview)):
+        return bytes(payload)
     if isinstance(payload, str):
         return payload.encode()
-    return str(payload).encode()
+    raise TypeError(f"Cannot coerce {type(payload).__name__} to bytes")
 
 
 class VisaDep(ABC):
+    __slots__ = ()
+
     @property
     @abstractmethod
     def is_open(self) -> bool: ...
@@ -53,7 +60,7 @@ class VisaDep(ABC):
     def close(self) -> None: ...
 
 
-@dataclass
+@dataclass(slots=True)
 class LocalVisaDep(VisaDep):
     """Local VISA resource dependency using pyvisa."""
 
@@ -85,8 +92,9 @@ class LocalVisaDep(VisaDep):
         return _coerce_bytes(self._ensure().read_bytes(n))
 
     def query(self, cmd: str) -> str:
-        self.write(cmd)
-        return self.read()
+        # Single resource-level query instead of separate write() + read()
+        # calls, each re-resolving the instrument through _ensure().
+        return _coerce_str(self._ensure().query(cmd))
 
     def clear(self) -> None:
         inst = self._ensure()
@@ -10,6 +10,26 @@ from typing import cast, Any
 from types import TracebackType
 
 
+def _offline_write(cmd: str) -> bool:
+    return True
+
+
+def _offline_read() -> str:
+    return ""
+
+
+def _offline_query(cmd: str) -> str:
+    return ""
+
+
+def _offline_write_binary_values(cmd: str, values: list[Any]) -> bool:
+    return True
+
+
+# I/O methods that VisaInst rebinds per instance once the target is known
+_IO_METHODS = ("write", "read", "query", "write_binary_values")
+
+
 class VisaInst:
     """
     Generic base class for instruments connected via VISA (TCP/IP, USB, etc.)
@@ -31,8 +51,27 @@ class VisaInst:
         self.offline: bool = offline
         self.inst: MessageBasedResource | None = None
 
+        if offline:
+            self._bind_io(
+                _offline_write, _offline_read, _offline_query, _offline_write_binary_values
+            )
         self.connect()  # RAII
 
+    def _bind_io(self, *fns: Any) -> None:
+        """
+        Shadow write/read/query/write_binary_values with the given callables,
+        so calls skip the offline/connected checks in the methods below.
+        Methods a subclass overrides are left alone.
+        """
+        cls = type(self)
+        for name, fn in zip(_IO_METHODS, fns):
+            if getattr(cls, name) is getattr(VisaInst, name):
+                setattr(self, name, fn)
+
+    def _unbind_io(self) -> None:
+        for name in _IO_METHODS:
+            self.__dict__.pop(name, None)
+
     def __enter__(self) -> "VisaInst":
         """Context manager entry."""
         return self
@@ -60,6 +99,8 @@ class VisaInst:
             self.inst = cast(MessageBasedResource, rm.open_resource(resource_string))
             self.inst.read_termination = "\n"
             self.inst.timeout = max(10000, getattr(self.inst, "timeout", 5000))
+            inst = self.inst
+            self._bind_io(inst.write, inst.read, inst.query, inst.write_binary_values)
 
             # Try to get instrument ID
             try:
@@ -81,7 +122,9 @@ class VisaInst:
             return True
 
         if self.inst:
+            self._unbind_io()
             self.inst.close()
+            self.inst = None
             return True
         return True
 
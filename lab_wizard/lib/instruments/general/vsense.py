@@ -6,8 +6,11 @@ Date: June 4, 2025
 Abstract base class for sensing instruments (multimeters, counters, oscilloscopes, etc.)
 """
 
+import logging
 from abc import ABC, abstractmethod
 
+logger = logging.getLogger(__name__)
+
 
 class VSense(ABC):
     """Abstract base class for single-channel sensing instruments.
@@ -22,6 +25,9 @@ class VSense(ABC):
     implement this interface.
     """
 
+    # Empty so that slotted channel implementations (e.g. Sim970Channel) stay dict-free
+    __slots__ = ()
+
     def __init__(self):
         self.connected = False
 
@@ -55,11 +61,11 @@ class StandInVSense(VSense):
         super().__init__()
         self.connected = True
         self.measurement_value = 0.0
-        print("Stand-in sensing instrument initialized.")
+        logger.debug("Stand-in sensing instrument initialized.")
 
     def disconnect(self) -> bool:
         self.connected = False
-        print("StandInVSense disconnected (no real hardware).")
+        logger.debug("StandInVSense disconnected (no real hardware).")
         return True
 
     def get_voltage(self) -> float:
@@ -6,8 +6,11 @@ Date: June 4, 2025
 Abstract base class for source instruments (voltage/current sources, signal generators, etc.)
 """
 
+import logging
 from abc import ABC, abstractmethod
 
+logger = logging.getLogger(__name__)
+
 
 class VSource(ABC):
     """
@@ -17,6 +20,9 @@ class VSource(ABC):
     Source instruments include voltage sources, current sources, signal generators, etc.
     """
 
+    # Empty so that slotted implementations (e.g. DBay channels) stay dict-free
+    __slots__ = ()
+
     def __init__(self):
         self.connected = False
 
@@ -81,6 +87,7 @@ class StandInVSource(VSource):
     """
     Stand-in class for VSource.
     This class can be used for testing or as a placeholder when no actual instrument is available.
+    Activity is reported at DEBUG level so sweeps over a stand-in stay cheap.
     """
 
     ignore_in_cli = True
@@ -89,37 +96,27 @@ class StandInVSource(VSource):
         self.connected = True  # Stand-in is always "connected"
         self.voltage = 0.0
         self.output_enabled = False
-        print("Stand-in voltage source initialized.")
+        logger.debug("Stand-in voltage source initialized.")
 
     def disconnect(self) -> bool:
-        print("This is not a real source. Using stand-in VSource.")
+        logger.debug("This is not a real source. Using stand-in VSource.")
         self.connected = False
         return not self.connected
 
     def set_voltage(self, voltage: float) -> bool:
         """Set the voltage (stand-in behavior)."""
-        print(f"Stand-in: Setting voltage to {voltage}V")
+        logger.debug("Stand-in: Setting voltage to %sV", voltage)
         self.voltage = voltage
         return True
 
     def turn_on(self) -> bool:
         """Turn on the output (stand-in behavior)."""
-        print(f"Stand-in: Turning on output")
+        logger.debug("Stand-in: Turning on output")
         self.output_enabled = True
         return True
 
     def turn_off(self) -> bool:
         """Turn off the output (stand-in behavior)."""
-        print(f"Stand-in: Turning off output")
-        self.output_enabled = False
-        return True
-        print(f"Stand-in: Turning on output{channel_str}")
-        self.output_enabled = True
-        return True
-
-    def turn_off(self, channel: int | None = None) -> bool:
-        """Turn off the output (stand-in behavior)."""
-        channel_str = f" on channel {channel}" if channel is not None else ""
-        print(f"Stand-in: Turning off output{channel_str}")
+        logger.debug("Stand-in: Turning off output")
         self.output_enabled = False
         return True
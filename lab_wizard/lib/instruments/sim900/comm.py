@@ -1,5 +1,4 @@
-from typing import Any
-import time
+from typing import Any, Iterable
 
 from lab_wizard.lib.instruments.general.gpib import GPIBComm
 from lab_wizard.lib.instruments.general.serial import SerialDep
@@ -11,6 +10,8 @@ class Sim900ChildDep:
     Handles GPIB communication with slot-specific commands
     """
 
+    __slots__ = ("gpib_comm", "slot", "offline")
+
     def __init__(self, serial_comm: SerialDep, gpibAddr: int, slot: int, **kwargs: Any):
         """
         :param serial_comm: Shared SerialDep instance from parent connection
@@ -36,6 +37,20 @@ class Sim900ChildDep:
         slot_cmd = f'CONN {self.slot}, "esc"\r\n{cmd}\r\nesc'
         return self.gpib_comm.write(slot_cmd)
 
+    def write_many(self, cmds: Iterable[str]) -> int | bool | None:
+        """
+        Write several commands to this slot inside a single CONN ... esc frame
+        :param cmds: The commands to send, in order. eg. ["VOLT 1.000", "OPON"]
+        :return: number of bytes written to the port
+        """
+        if self.offline:
+            return True
+
+        body = "\r\n".join(cmds)
+        if not body:
+            return 0
+        return self.gpib_comm.write(f'CONN {self.slot}, "esc"\r\n{body}\r\nesc')
+
     def read(self) -> bytes | str:
         """
         Read from the GPIB module
@@ -53,6 +68,6 @@ class Sim900ChildDep:
         """
         if self.offline:
             return ""
-        self.write(cmd)
-        time.sleep(0.1)  # Small delay for slot communication
-        return self.read()
+        # GPIBComm.query reads until the terminator arrives (or sleeps its
+        # legacy_delay if configured), so no fixed delay is needed here
+        return self.gpib_comm.query(f'CONN {self.slot}, "esc"\r\n{cmd}\r\nesc')
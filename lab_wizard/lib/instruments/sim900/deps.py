@@ -9,6 +9,8 @@ class Sim900Dep(Dependency):
     Safe to import at runtime (no circular deps).
     """
 
+    __slots__ = ("serial", "gpibAddr")
+
     def __init__(self, parent_dep: SerialDep, gpibAddr: int):
         self.serial = parent_dep
         self.gpibAddr = gpibAddr
@@ -61,6 +61,11 @@ class Sim928(Child[Sim900Dep, Sim928Params], VSource):
         result = self.dep.write("OPON")
         return result is not None and result is not False
 
+    def set_voltage_and_turn_on(self, voltage: float) -> bool:
+        """Set the voltage and enable the output in one slot transaction."""
+        result = self.dep.write_many((f"VOLT {voltage:0.3f}", "OPON"))
+        return result is not None and result is not False
+
     def turn_off(self) -> bool:  # type: ignore[override]
         result = self.dep.write("OPOF")
         return result is not None and result is not False
@@ -44,6 +44,8 @@ class Sim970Channel(VSense):
     the parent ``Sim970`` and exposed via ``Sim970.channels``.
     """
 
+    __slots__ = ("_dep", "channel_index", "settling_time", "max_retries", "connected")
+
     def __init__(
         self, dep: Sim900ChildDep, channel_index: int, settling: float, retries: int
     ):
@@ -66,12 +68,12 @@ class Sim970Channel(VSense):
         channel_scpi = self.channel_index + 1  # hardware channels are 1-based
         cmd = f"VOLT? {channel_scpi}"
         volts = self._dep.query(cmd)  # type: ignore[attr-defined]
-        time.sleep(self.settling_time)
-        volts = self._dep.query(cmd)  # type: ignore[attr-defined]
         try:
             return float(volts)
         except ValueError:
             if recurse < self.max_retries:
+                # Let the module settle only when a reading came back garbled
+                time.sleep(self.settling_time)
                 return self._get_voltage_impl(recurse + 1)
             raise ValueError(f"Could not parse voltage reading: {volts}")
 
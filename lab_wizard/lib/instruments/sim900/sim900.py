@@ -10,7 +10,7 @@ Includes:
   sim921 (AC resistance bridge)
 """
 
-from typing import Annotated, Literal, cast, TypeVar, Any
+from typing import Annotated, Literal, Sequence, TypeVar, Any
 from pydantic import Field
 
 
@@ -20,10 +20,16 @@ from lab_wizard.lib.instruments.general.parent_child import (
     Child,
     ChildParams,
 )
+from lab_wizard.lib.instruments.general.parent_helpers import (
+    standard_add_child,
+    standard_init_child_by_key,
+    standard_init_children,
+)
 
 from lab_wizard.lib.instruments.sim900.modules.sim928 import Sim928Params
 from lab_wizard.lib.instruments.sim900.modules.sim970 import Sim970Params
 from lab_wizard.lib.instruments.sim900.modules.sim921 import Sim921Params
+from lab_wizard.lib.instruments.general.gpib import GPIBComm
 from lab_wizard.lib.instruments.general.serial import SerialDep
 from lab_wizard.lib.instruments.sim900.deps import Sim900Dep
 
@@ -65,6 +71,8 @@ class Sim900(Parent[Sim900Dep, Sim900ChildParams], Child[SerialDep, Any]):
         self.params = params
         self._dep = dep
         self.children: dict[str, Child[Sim900Dep, Any]] = {}
+        # Mainframe-level GPIB channel, used for queries spanning several slots
+        self._comm = GPIBComm(dep.serial, dep.gpibAddr)
 
     # Child interface requirement
     @property
@@ -89,27 +97,42 @@ class Sim900(Parent[Sim900Dep, Sim900ChildParams], Child[SerialDep, Any]):
         return self._dep
 
     def init_child_by_key(self, key: str) -> Child[Sim900Dep, Any]:
-        params = self.params.children[key]
-        child_cls = params.inst
-        # The specific param subtype matches child_cls, but the type checker
-        # cannot express this dependency (params is a union). Cast to silence
-        # the variance/union complaint.
-        # child_typed = cast(type[Child[Sim900Dep, Sim900ChildParams]], child_cls)
-        child = child_cls.from_params_with_dep(self.dep, key, params)
-        self.children[key] = child
-        return child
+        return standard_init_child_by_key(self, key)
 
     def init_children(self) -> None:
-        for key in list(self.params.children.keys()):
-            self.init_child_by_key(key)
+        standard_init_children(self)
 
     def add_child(self, params: ChildParams[TChild], key: str) -> TChild:
-        self.params.children[key] = params  # type: ignore[assignment]
-        child_cls = params.inst
-        child = child_cls.from_params_with_dep(self.dep, key, params)
-        self.children[key] = cast(Child[Sim900Dep, Any], child)
-        return child
-
+        return standard_add_child(self, params, key)  # type: ignore[return-value]
+
+    def query_batch(self, requests: Sequence[tuple[int, str]]) -> list[bytes]:
+        """
+        Query several slots with a single serial write.
+
+        Each (slot, cmd) pair gets its own CONN ... esc frame. All frames go
+        out together and the replies are read back in request order, so N
+        queries cost one round trip instead of N.
+        :param requests: (slot, command) pairs, e.g. [(1, "VOLT? 1"), (5, "RVAL?")]
+        :return: one reply per request, including the terminator
+            (b"" for replies that did not arrive before the timeout)
+        """
+        if not requests:
+            return []
+        comm = self._comm
+        terminator = comm.read_terminator
+        n = len(requests)
+        buf = bytearray()
+        with comm.port_lock():
+            comm.write_many(f'CONN {slot}, "esc"\r\n{cmd}\r\nesc' for slot, cmd in requests)
+            while buf.count(terminator) < n:
+                chunk = comm.read()
+                if not chunk:  # timed out
+                    break
+                buf += chunk
+
+        replies = [line + terminator for line in bytes(buf).split(terminator)[:-1]]
+        replies.extend(b"" for _ in range(n - len(replies)))
+        return replies[:n]
 
 if __name__ == "__main__":
     print("yes")
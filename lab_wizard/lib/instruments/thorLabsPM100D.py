@@ -67,6 +67,12 @@ class ThorLabsPM100D(GenericSense):
         self.averaging_count = kwargs.get("averaging_count", 1)
         self.wavelength = kwargs.get("wavelength", 1550)  # nm
 
+        # Static part of get_info(), built once
+        self._info_template: Dict[str, Any] = {
+            "instrument_type": "ThorLabs PM100D Power Meter",
+            "device_path": self.device_path,
+        }
+
     def connect(self) -> bool:
         """Connect to the power meter"""
         try:
@@ -238,15 +244,15 @@ class ThorLabsPM100D(GenericSense):
 
     def get_info(self) -> Dict[str, Any]:
         """Get instrument information"""
+        connected = self.is_connected()
         info = {
-            "instrument_type": "ThorLabs PM100D Power Meter",
-            "device_path": self.device_path,
-            "connected": self.is_connected(),
+            **self._info_template,
+            "connected": connected,
             "averaging_count": self.averaging_count,
             "wavelength_nm": self.wavelength,
         }
 
-        if self.is_connected():
+        if connected:
             try:
                 range_info = self.get_range()
                 info["power_range_watts"] = range_info
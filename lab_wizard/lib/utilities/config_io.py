@@ -36,7 +36,7 @@ Provided functions:
 """
 
 from pathlib import Path
-from typing import Any,Dict,Optional,Tuple,List,cast
+from typing import Any,Callable,Dict,Optional,Tuple,List,cast
 
 from ruamel.yaml import YAML
 from ruamel.yaml.comments import CommentedMap
@@ -189,6 +189,39 @@ def _attach_children(
         parent_params.children[key] = child_params  # type: ignore[attr-defined]
 
 
+def _prologix_key(params: Any) -> str:
+    return getattr(params, "port", None) or "<unknown>"
+
+
+def _dbay_key(params: Any) -> str:
+    host = getattr(params, "server_address", None) or "localhost"
+    port = getattr(params, "port", 8345)
+    return f"{host}:{port}"
+
+
+# Top-level dict key derivation per instrument type, one table for files
+# directly under instruments/ and one for files in the known parent folders.
+# Types not listed fall back to a caller-supplied default (usually the type
+# string itself).
+_TOP_LEVEL_KEY_FNS: Dict[str, Callable[[Any], str]] = {
+    "prologix_gpib": _prologix_key,
+    "dbay": _dbay_key,
+}
+
+_FOLDER_KEY_FNS: Dict[str, Callable[[Any], str]] = {
+    "dbay": _dbay_key,
+    # sim900 at top-level has no natural dict key; default to "sim900"
+    "sim900": lambda params: "sim900",
+}
+
+
+def _top_level_key(
+    key_fns: Dict[str, Callable[[Any], str]], type_str: str, params: Any, default: str
+) -> str:
+    key_fn = key_fns.get(type_str)
+    return key_fn(params) if key_fn is not None else default
+
+
 def load_instruments(
     config_dir: str | Path,
     visited_paths: Optional[set[Path]] = None,
@@ -218,15 +251,7 @@ def load_instruments(
 
         _attach_children(base_dir, params, raw, visited_paths)
         type_str = str(raw.get("type") or "")
-        if type_str == "prologix_gpib":
-            key = getattr(params, "port", None) or "<unknown>"
-        elif type_str == "dbay":
-            host = getattr(params, "server_address", None) or "localhost"
-            port = getattr(params, "port", 8345)
-            key = f"{host}:{port}"
-        else:
-            # Generic fallback using type
-            key = type_str
+        key = _top_level_key(_TOP_LEVEL_KEY_FNS, type_str, params, type_str)
         instruments[key] = params
 
     # Known parent folders (DBay). Rather than relying on hard-coded
@@ -245,15 +270,7 @@ def load_instruments(
 
             _attach_children(base_dir, params, raw, visited_paths)
             type_name = str(raw.get("type") or "")
-            if type_name == "dbay":
-                host = getattr(params, "server_address", None) or "localhost"
-                port = getattr(params, "port", 8345)
-                key = f"{host}:{port}"
-            elif type_name == "sim900":
-                # sim900 at top-level has no natural dict key; default to "sim900"
-                key = "sim900"
-            else:
-                key = type_name or folder
+            key = _top_level_key(_FOLDER_KEY_FNS, type_name, params, type_name or folder)
             instruments[key] = params
 
     return instruments
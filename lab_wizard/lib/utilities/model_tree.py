@@ -1,8 +1,12 @@
+import re
+
 from pydantic import BaseModel, Field, model_validator
 from typing import Any, List, Annotated, Literal
 
 from lab_wizard.lib.utilities.params_discovery import load_params_class
 
+_INSTRUMENT_KEY_RE = re.compile(r"instruments\['([^']+)'\]")
+
 
 class FileSaver(BaseModel):
     type: Literal["file_saver"] = "file_saver"
@@ -162,9 +166,7 @@ class Exp(BaseModel):
                 # Determine the type and generate a variable name
                 if "instruments[" in current_path:
                     # Extract instrument key for naming
-                    import re
-
-                    match = re.search(r"instruments\['([^']+)'\]", current_path)
+                    match = _INSTRUMENT_KEY_RE.search(current_path)
                     if match:
                         inst_key = match.group(1)
                         var_name = f"{inst_key}_{counter[inst_key]}"
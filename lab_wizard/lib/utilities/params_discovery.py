@@ -18,9 +18,11 @@ from __future__ import annotations
 import importlib
 import json
 import re
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
+from lab_wizard.lib.instruments.general.parent_child import ChildParams
 
 # Files/folders to skip during scanning (utilities, not instrument definitions)
 SKIP_NAMES = {
@@ -32,6 +34,12 @@ SKIP_NAMES = {
     "__pycache__",
 }
 
+# Class definitions ending in Params
+_CLASS_RE = re.compile(r'class\s+(\w+Params)\s*\(')
+# type Literal assignments: type: Literal["something"] = "something"
+# (handles both single and double quotes)
+_TYPE_RE = re.compile(r'type:\s*Literal\[(["\'])([^"\']+)\1\]')
+
 # Cache location
 CACHE_DIR = Path.home() / ".cache" / "lab_wizard"
 CACHE_FILE = CACHE_DIR / "params_cache.json"
@@ -68,7 +76,8 @@ def _get_folder_fingerprint(instruments_dir: Path) -> tuple[float, int]:
 
 def _should_skip(path: Path) -> bool:
     """Check if file/folder should be skipped during scanning."""
-    return path.name in SKIP_NAMES or any(skip in path.parts for skip in SKIP_NAMES)
+    # path.name is the last element of path.parts, so one set check covers both
+    return not SKIP_NAMES.isdisjoint(path.parts)
 
 
 def _scan_file_for_params(path: Path, instruments_dir: Path) -> list[tuple[str, str, str]]:
@@ -89,16 +98,13 @@ def _scan_file_for_params(path: Path, instruments_dir: Path) -> list[tuple[str,
         return results
     
     # Find class definitions ending in Params
-    class_pattern = re.compile(r'class\s+(\w+Params)\s*\(')
-    class_matches = class_pattern.findall(content)
+    class_matches = _CLASS_RE.findall(content)
     
     if not class_matches:
         return results
     
-    # Find type Literal assignments: type: Literal["something"] = "something"
-    # This pattern handles both single and double quotes
-    type_pattern = re.compile(r'type:\s*Literal\[(["\'])([^"\']+)\1\]')
-    type_match = type_pattern.search(content)
+    # Find the type Literal assignment
+    type_match = _TYPE_RE.search(content)
     
     if not type_match:
         return results
@@ -236,22 +242,31 @@ def load_params_class(type_str: str, verbose: bool = True) -> type:
         ValueError: If type_str is not found in the instruments folder
     """
     # Check in-memory cache first
-    if type_str in _loaded_params:
+    cls = _loaded_params.get(type_str)
+    if cls is not None:
         if verbose:
-            print(f"  [cache hit] '{type_str}' -> {_loaded_params[type_str].__name__}")
-        return _loaded_params[type_str]
-    
+            print(f"  [cache hit] '{type_str}' -> {cls.__name__}")
+        return cls
+
+    # Child types whose module is already imported are in the ChildParams
+    # registry; this skips the folder fingerprint/scan entirely.
+    cls = ChildParams.registered_type(type_str)
+    if cls is not None:
+        if verbose:
+            print(f"  [registered] '{type_str}' -> {cls.__name__}")
+        _loaded_params[type_str] = cls
+        return cls
+
     type_map = get_type_to_module_map()
     
-    if type_str not in type_map:
+    info = type_map.get(type_str)
+    if info is None:
         available = ", ".join(sorted(type_map.keys()))
         raise ValueError(
             f"Unknown instrument type '{type_str}'. "
             f"Available types: {available}"
         )
     
-    info = type_map[type_str]
-    
     if verbose:
         print(f"  [importing] '{type_str}' from {info['module']}.{info['class_name']}")
     
@@ -264,9 +279,12 @@ def load_params_class(type_str: str, verbose: bool = True) -> type:
     return cls
 
 
+@lru_cache(maxsize=256)
 def get_config_folder(params_cls: type) -> str | None:
     """
     Derive the config folder path from a Params class's module path.
+
+    The result depends only on the class, so it is memoized per class.
     
     This determines where YAML files for this instrument type should be saved
     under config/instruments/.
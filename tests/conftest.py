@@ -26,6 +26,11 @@ class _FakeSerial:
     def __init__(self, *_, **__):  # type: ignore[no-untyped-def]
         self.is_open = True
         self._buffer = b"0.0"
+        # Pending reply bytes; every write is answered with one "0.0" line
+        self._rx = bytearray()
+
+    def open(self):
+        self.is_open = True
 
     def close(self):
         self.is_open = False
@@ -36,16 +41,23 @@ class _FakeSerial:
     def write(self, data: bytes):  # noqa: D401
         # simplistic: store last command; could tailor responses by command later
         self._last = data
+        self._rx += b"0.0\n"
         return len(data)
 
+    @property
+    def in_waiting(self) -> int:
+        return len(self._rx)
+
     def readline(self) -> bytes:  # noqa: D401
         return b"0.0\n"
 
     def read_all(self) -> bytes:
         return b""
 
-    def read(self, size: int):  # noqa: D401
-        return b""
+    def read(self, size: int = 1):  # noqa: D401
+        out = bytes(self._rx[:size])
+        del self._rx[:size]
+        return out
 
 
 _fake_serial_module = _types_mod.ModuleType("serial")
@@ -52,3 +52,39 @@ def test_requested_chain_expression():
     assert sim900.children.get("1") is sim928
 
     print(sim900.children)
+
+
+def test_add_child_dict_rejects_types_outside_union():
+    controller = PrologixGPIBParams(port="FAKE").create_inst()
+    # sim928 is a registered ChildParams type, but not a Prologix child
+    with pytest.raises(ValueError):
+        controller.add_child({"type": "sim928"}, 3)
+    assert controller.params.children == {}
+
+    sim900 = controller.add_child({"type": "sim900"}, 4)
+    assert controller.get_child("4") is sim900
+    assert isinstance(controller.params.children["4"], Sim900Params)
+
+
+def test_int_gpib_addresses_are_bounds_checked():
+    controller = PrologixGPIBParams(port="FAKE").create_inst()
+    sim900 = controller.add_child(Sim900Params(), 30)
+    assert controller.get_child(30) is sim900
+    assert controller.get_child(-1) is None
+    assert controller.get_child(40) is None
+    with pytest.raises(ValueError):
+        controller.add_child(Sim900Params(), 31)
+    with pytest.raises(ValueError):
+        controller.child_key(-1)
+
+
+def test_only_canonical_keys_are_indexed_by_address():
+    controller = PrologixGPIBParams(port="FAKE").create_inst()
+    controller.add_child(Sim900Params(), "05")
+    assert controller.get_child(5) is None
+    assert controller.get_child("05") is not None
+    # Non-ASCII digits are neither an address nor an error
+    child = object()
+    controller._store_child("²", child)  # type: ignore[arg-type]
+    assert controller.get_child(2) is None
+    assert controller.get_child("²") is child
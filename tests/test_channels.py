@@ -16,3 +16,31 @@ def test_channelchild_interface_presence():
     assert d.get_channel(1) == 2
     assert list(iter(d)) == [1, 2, 3]
     assert d[2] == 3
+
+
+def test_get_channel_rejects_out_of_range_and_negative_indices():
+    import pytest
+
+    class Dummy(ChannelProvider[int]):  # type: ignore[type-arg]
+        def __init__(self):
+            self.channels = [1, 2, 3]
+
+    d = Dummy()
+    for bad in (-1, -3, 3):
+        with pytest.raises(IndexError):
+            d.get_channel(bad)
+        with pytest.raises(IndexError):
+            d[bad]
+
+
+def test_getitem_uses_overridden_get_channel():
+    class OneBased(ChannelProvider[str]):  # type: ignore[type-arg]
+        def __init__(self):
+            self.channels = ["a", "b"]
+
+        def get_channel(self, index: int) -> str:
+            return super().get_channel(index - 1)
+
+    d = OneBased()
+    assert d[1] == "a"
+    assert d[2] == "b"
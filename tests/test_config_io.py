@@ -149,3 +149,31 @@ if __name__ == "__main__":
     test_orphan_module_preservation(pathlib.Path("test_output"))
     test_enabled_flag(pathlib.Path("test_output"))
     print("Tests passed!")
+
+
+def test_top_level_keys_per_loop(tmp_path: pathlib.Path):
+    """Files directly under instruments/ and under instruments/dbay/ are keyed
+    by their own rules: a prologix_gpib file is keyed by port only at the top
+    level, and by its type name inside the dbay folder."""
+    cfg = tmp_path / "config"
+    inst_dir = cfg / "instruments"
+    _write(inst_dir / "prologix.yml", """
+type: prologix_gpib
+port: /dev/ttyUSB3
+""")
+    _write(inst_dir / "dbay" / "dbay.yml", """
+type: dbay
+server_address: 10.7.0.4
+port: 8345
+""")
+    _write(inst_dir / "dbay" / "stray_prologix.yml", """
+type: prologix_gpib
+port: /dev/ttyUSB7
+""")
+
+    instruments = load_instruments(cfg)
+
+    assert instruments["/dev/ttyUSB3"].port == "/dev/ttyUSB3"
+    assert isinstance(instruments["10.7.0.4:8345"], DBayParams)
+    assert instruments["prologix_gpib"].port == "/dev/ttyUSB7"
+    assert set(instruments) == {"/dev/ttyUSB3", "10.7.0.4:8345", "prologix_gpib"}
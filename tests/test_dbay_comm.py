@@ -0,0 +1,94 @@
+import pytest
+import requests
+
+from lab_wizard.lib.instruments.dbay.comm import Comm
+from lab_wizard.lib.instruments.dbay.dbay import DBayParams
+from lab_wizard.lib.instruments.dbay.modules.dac4d import Dac4DParams
+
+
+def test_full_state_fetched_once_per_chassis(monkeypatch):
+    calls: list[str] = []
+    real_get = requests.get
+
+    def counting_get(url: str, *args, **kwargs):  # type: ignore[no-untyped-def]
+        calls.append(url)
+        return real_get(url, *args, **kwargs)
+
+    monkeypatch.setattr(requests, "get", counting_get)
+
+    dbay = DBayParams(server_address="FAKE").create_inst()
+    dbay.add_child(Dac4DParams(), "1")
+    dbay.add_child(Dac4DParams(), "1")
+    assert len(calls) == 1
+
+    # Any put through the shared Comm drops the cached state
+    dbay.comm.put("dac4D/vsource/", data={})
+    dbay.add_child(Dac4DParams(), "1")
+    assert len(calls) == 2
+
+
+def test_dac4d_defaults_do_not_patch_cached_state(monkeypatch):
+    # Chassis state without the optional fields Dac4D fills in defaults for
+    class SparseResponse:
+        status_code = 200
+
+        def json(self):  # type: ignore[no-untyped-def]
+            return {"data": [{}, {"core": {"type": "dac4D"}}]}
+
+    def sparse_get(url: str, *args, **kwargs):  # type: ignore[no-untyped-def]
+        return SparseResponse()
+
+    monkeypatch.setattr(requests, "get", sparse_get)
+
+    dbay = DBayParams(server_address="FAKE").create_inst()
+    dbay.add_child(Dac4DParams(), "1")
+    assert dbay.comm.get_full_state()["data"][1] == {"core": {"type": "dac4D"}}
+
+
+def test_map_concurrent_preserves_order():
+    comm = Comm("FAKE", 8345)
+    try:
+        assert comm.map_concurrent(lambda x: x * x, range(40)) == [x * x for x in range(40)]
+    finally:
+        comm.close()
+
+
+def test_map_concurrent_runs_sequentially_when_pool_refuses_work():
+    comm = Comm("FAKE", 8345)
+    comm.map_concurrent(lambda x: x, [0])
+    pool = comm._pool
+    pool.shutdown()  # submit() now raises RuntimeError, as at interpreter exit
+    calls: list[int] = []
+
+    def fn(x: int) -> int:
+        calls.append(x)
+        return -x
+
+    assert comm.map_concurrent(fn, [1, 2, 3]) == [-1, -2, -3]
+    assert calls == [1, 2, 3]
+
+
+def test_map_concurrent_does_not_replay_fn_errors():
+    comm = Comm("FAKE", 8345)
+    calls: list[int] = []
+
+    def fn(x: int) -> int:
+        calls.append(x)
+        if x == 2:
+            raise RuntimeError("PUT failed")
+        return x
+
+    try:
+        with pytest.raises(RuntimeError, match="PUT failed"):
+            comm.map_concurrent(fn, [1, 2, 3])
+        assert sorted(calls) == [1, 2, 3]
+    finally:
+        comm.close()
+
+
+def test_dbay_disconnect_shuts_down_pool():
+    dbay = DBayParams(server_address="FAKE").create_inst()
+    dac = dbay.add_child(Dac4DParams(), "1")
+    dbay.disconnect()
+    assert not dac.connected
+    assert dbay.comm._pool is None
@@ -0,0 +1,45 @@
+import pytest
+
+from lab_wizard.lib.instruments.general import http_dep
+from lab_wizard.lib.instruments.general.http_dep import LocalHttpDep
+
+
+class FakeSession:
+    instances: list["FakeSession"] = []
+
+    def __init__(self):
+        self.requests: list[tuple[str, str]] = []
+        self.closed = False
+        FakeSession.instances.append(self)
+
+    def mount(self, prefix: str, adapter: object) -> None:
+        pass
+
+    def request(self, method: str, url: str, **_):  # type: ignore[no-untyped-def]
+        self.requests.append((method, url))
+        return type("Resp", (), {"content": b"ok"})()
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def test_session_closed_and_reopened_lazily(monkeypatch: pytest.MonkeyPatch):
+    FakeSession.instances.clear()
+    monkeypatch.setattr(http_dep.requests, "Session", FakeSession)
+
+    dep = LocalHttpDep("http://fake")
+    assert not dep.is_open  # no session until the first request
+    assert dep.get("/state") == b"ok"
+    dep.put("dac", {"v": 1})
+    assert dep.is_open
+    first = FakeSession.instances[0]
+    assert first.requests == [("GET", "http://fake/state"), ("PUT", "http://fake/dac")]
+
+    dep.close()
+    assert first.closed
+    assert not dep.is_open
+
+    dep.get("state")
+    assert dep.is_open
+    assert len(FakeSession.instances) == 2
+    assert FakeSession.instances[1].requests == [("GET", "http://fake/state")]
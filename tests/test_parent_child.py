@@ -0,0 +1,131 @@
+import threading
+from typing import Any
+
+import pytest
+
+from lab_wizard.lib.instruments.general.parent_child import Dependency, Parent
+
+
+class SerialLikeDep(Dependency):
+    pass
+
+
+class HttpLikeDep(Dependency):
+    concurrent_safe = True
+
+
+class DummyParent(Parent[Any, Any]):
+    """Minimal Parent holding pre-built children, for measure_all tests."""
+
+    def __init__(self, dep: Dependency, children: dict[str, Any]):
+        self._dep = dep
+        self.children = children
+
+    @property
+    def dep(self) -> Dependency:
+        return self._dep
+
+    def init_child_by_key(self, key: str) -> Any:
+        raise NotImplementedError
+
+    def init_children(self) -> None:
+        pass
+
+    def add_child(self, params: Any, key: str) -> Any:
+        raise NotImplementedError
+
+
+class Meter:
+    def __init__(self, value: float):
+        self.value = value
+        self.thread: str | None = None
+
+    def measure(self) -> float:
+        self.thread = threading.current_thread().name
+        return self.value
+
+
+class Source:
+    """A child with no measure() method."""
+
+
+def test_measure_all_sequential_on_shared_bus():
+    a, b = Meter(1.0), Meter(2.0)
+    parent = DummyParent(SerialLikeDep(), {"1": a, "2": Source(), "3": b})
+    assert parent.measure_all() == {"1": 1.0, "3": 2.0}
+    main = threading.current_thread().name
+    assert a.thread == main and b.thread == main
+
+
+def test_measure_all_uses_pool_when_dep_is_concurrent_safe():
+    a, b = Meter(1.0), Meter(2.0)
+    parent = DummyParent(HttpLikeDep(), {"a": a, "src": Source(), "b": b})
+    assert parent.measure_all() == {"a": 1.0, "b": 2.0}
+    main = threading.current_thread().name
+    assert a.thread != main and b.thread != main
+
+
+@pytest.mark.parametrize("dep", [SerialLikeDep(), HttpLikeDep()])
+def test_measure_all_propagates_child_errors(dep: Dependency):
+    class Broken:
+        def measure(self) -> float:
+            raise ValueError("bad reading")
+
+    parent = DummyParent(dep, {"ok": Meter(1.0), "broken": Broken()})
+    with pytest.raises(ValueError, match="bad reading"):
+        parent.measure_all()
+
+
+def test_concrete_child_params_without_type_is_rejected():
+    from lab_wizard.lib.instruments.general.parent_child import ChildParams
+
+    # Abstract intermediates may leave 'type' to their subclasses
+    class AbstractBase(ChildParams[Any]):
+        pass
+
+    with pytest.raises(TypeError, match="must declare a 'type' literal field"):
+
+        class NoType(AbstractBase):
+            @property
+            def inst(self) -> Any:
+                return object
+
+
+def test_child_params_type_registry(monkeypatch: pytest.MonkeyPatch):
+    from typing import Literal
+
+    from lab_wizard.lib.instruments.general.parent_child import ChildParams
+    from lab_wizard.lib.utilities import params_discovery
+
+    class RegisteredParams(ChildParams[Any]):
+        type: Literal["test_registered"] = "test_registered"
+
+        @property
+        def inst(self) -> Any:
+            return object
+
+    try:
+        assert ChildParams.registered_type("test_registered") is RegisteredParams
+        assert ChildParams.registered_type("no_such_type") is None
+
+        # Already-imported types resolve without scanning the instruments folder
+        def no_scan() -> Any:
+            raise AssertionError("folder scan should be skipped")
+
+        monkeypatch.setattr(params_discovery, "get_type_to_module_map", no_scan)
+        loaded = params_discovery.load_params_class("test_registered", verbose=False)
+        assert loaded is RegisteredParams
+
+        with pytest.raises(TypeError, match="already registered"):
+
+            class Duplicate(ChildParams[Any]):
+                type: Literal["test_registered"] = "test_registered"
+
+                @property
+                def inst(self) -> Any:
+                    return object
+
+        assert ChildParams.registered_type("test_registered") is RegisteredParams
+    finally:
+        ChildParams._TYPE_REGISTRY.pop("test_registered", None)
+        params_discovery._loaded_params.pop("test_registered", None)
@@ -0,0 +1,354 @@
+import threading
+import types
+
+import pytest
+
+from lab_wizard.lib.instruments.general import gpib as gpib_mod
+from lab_wizard.lib.instruments.general import serial as serial_mod
+from lab_wizard.lib.instruments.general.gpib import GPIBComm
+from lab_wizard.lib.instruments.general.serial import LocalSerialDep
+
+
+class FakePort:
+    """In-memory stand-in for pyserial.Serial: records writes, replays rx."""
+
+    def __init__(self, *_, **__):  # type: ignore[no-untyped-def]
+        self.is_open = True
+        self.written: list[bytes] = []
+        self.rx = bytearray()
+        self.fail_writes = False
+
+    @property
+    def in_waiting(self) -> int:
+        return len(self.rx)
+
+    def read(self, size: int = 1) -> bytes:
+        out = bytes(self.rx[:size])
+        del self.rx[:size]
+        return out
+
+    def write(self, data: bytes) -> int:
+        if self.fail_writes:
+            raise OSError("write failed")
+        self.written.append(bytes(data))
+        return len(data)
+
+    def close(self):
+        self.is_open = False
+
+
+@pytest.fixture
+def dep(monkeypatch: pytest.MonkeyPatch) -> LocalSerialDep:
+    monkeypatch.setattr(serial_mod, "pyserial", types.SimpleNamespace(Serial=FakePort))
+    d = LocalSerialDep("FAKE", timeout=0.05)
+    d._ensure()
+    return d
+
+
+def test_failed_batch_forgets_gpib_addr(dep: LocalSerialDep):
+    gpib = GPIBComm(dep, 5)
+    with pytest.raises(RuntimeError):
+        with dep.batched():
+            gpib.write("A")
+            raise RuntimeError
+    gpib.write("B")
+    assert dep._serial.written == [b"++addr 5\nB\n"]
+
+
+def test_failed_flush_forgets_gpib_addr(dep: LocalSerialDep):
+    gpib = GPIBComm(dep, 5)
+    dep._serial.fail_writes = True
+    with pytest.raises(OSError):
+        with dep.batched():
+            gpib.write("A")
+    dep._serial.fail_writes = False
+    gpib.write("B")
+    assert dep._serial.written == [b"++addr 5\nB\n"]
+
+
+def test_write_many_inside_batch_keeps_order(dep: LocalSerialDep):
+    gpib = GPIBComm(dep, 5)
+    with gpib.batch():
+        gpib.write("first")
+        gpib.write_many(["second", "third"])
+    assert dep._serial.written == [b"++addr 5\nfirst\nsecond\nthird\n"]
+
+
+def test_gpib_query_holds_port_lock_until_reply(
+    dep: LocalSerialDep, monkeypatch: pytest.MonkeyPatch
+):
+    port = dep._serial
+    seen: list[bool] = []
+
+    def try_lock() -> None:
+        got = dep.lock.acquire(blocking=False)
+        if got:
+            dep.lock.release()
+        seen.append(got)
+
+    def poll_sleep(_: float) -> None:
+        # Between polls for the reply, another thread must not get the port
+        t = threading.Thread(target=try_lock)
+        t.start()
+        t.join()
+        port.rx += b"1.0\n"
+
+    monkeypatch.setattr(gpib_mod.time, "sleep", poll_sleep)
+    assert GPIBComm(dep, 5).query("VOLT?") == b"1.0\n"
+    assert seen == [False]
+
+
+def test_query_with_shared_fake_serial():
+    # Uses the conftest fake serial module, which answers each write with "0.0"
+    with LocalSerialDep("FAKE") as d:
+        assert d.query("X") == b"0.0\n"
+
+
+def test_readline_splits_chunks_and_keeps_leftover(dep: LocalSerialDep):
+    port = dep._serial
+    port.rx += b"1.0\r\n2.0\r\n3."
+    assert dep.readline() == b"1.0\r\n"
+    # The rest arrived in the same chunk and is served without a port read
+    assert port.rx == b""
+    assert dep.readline() == b"2.0\r\n"
+    port.rx += b"5\n"
+    assert dep.readline() == b"3.5\n"
+    port.rx += b"xy"
+    assert dep.read(1) == b"x"
+    assert dep.readline() == b"y"
+
+
+def test_readline_returns_partial_line_on_timeout(dep: LocalSerialDep):
+    dep._serial.rx += b"1.2"
+    assert dep.readline() == b"1.2"
+    assert dep.readline() == b""
+
+
+def test_background_reader_serves_reads_from_queue(dep: LocalSerialDep):
+    dep.timeout = 1.0
+    port = dep._serial
+    dep.start_reader()
+    port.rx += b"1.0\n2."
+    assert dep.readline() == b"1.0\n"
+    # Line completed by a later chunk
+    threading.Timer(0.02, port.rx.extend, (b"5\n",)).start()
+    assert dep.readline() == b"2.5\n"
+    port.rx += b"abc"
+    assert dep.read(3) == b"abc"
+    assert port.rx == b""
+
+
+def test_close_stops_background_reader(dep: LocalSerialDep):
+    dep.start_reader()
+    thread = dep._reader
+    dep.close()
+    assert dep._reader is None
+    assert not thread.is_alive()
+
+
+def test_background_reader_warns_on_overflow(caplog: pytest.LogCaptureFixture):
+    from collections import deque
+
+    stop = threading.Event()
+    chunks = [b"a", b"b", b"c"]
+
+    class Port:
+        port = "FAKE"
+
+        def read(self, size: int) -> bytes:
+            if chunks:
+                return chunks.pop(0)
+            stop.set()
+            return b""
+
+    rx: deque[bytes] = deque(maxlen=2)
+    with caplog.at_level("WARNING"):
+        LocalSerialDep._reader_loop(Port(), rx, threading.Event(), stop)
+    assert list(rx) == [b"b", b"c"]
+    assert "dropping oldest" in caplog.text
+
+
+def test_gpibmodules_sharing_a_port_reselect_addresses():
+    from lab_wizard.lib.instruments.general.serial_inst_old import GPIBmodule
+
+    sent: list[bytes] = []
+    a = GPIBmodule("SHARED", 4)
+    b = GPIBmodule("SHARED", 7)
+    for module in (a, b):
+        module._write = sent.append  # type: ignore[method-assign]
+    a.connect()
+    a.write("A1")
+    a.write("A2")
+    b.write("B1")
+    a.write("A3")
+    assert sent == [b"++addr 4\nA1\n", b"A2\n", b"++addr 7\nB1\n", b"++addr 4\nA3\n"]
+    a.disconnect()
+
+
+def test_write_bytes_unbatched_and_batched(dep: LocalSerialDep):
+    gpib = GPIBComm(dep, 5)
+    gpib.write_bytes(b"*IDN?\n")
+    gpib.write_bytes(b"*CLS\n")
+    with gpib.batch():
+        assert gpib.write_bytes(b"*RST\n") == 0
+        gpib.write("VOLT 1.0")
+        assert dep._serial.written == [b"++addr 5\n*IDN?\n", b"*CLS\n"]
+    assert dep._serial.written[2:] == [b"*RST\nVOLT 1.0\n"]
+
+
+@pytest.fixture
+def pipe_dep(monkeypatch: pytest.MonkeyPatch):
+    """LocalSerialDep in raw_writes mode whose fd is the write end of a pipe."""
+    import os
+
+    rfd, wfd = os.pipe()
+    os.set_blocking(wfd, False)
+
+    class PipePort(FakePort):
+        def fileno(self) -> int:
+            return wfd
+
+    monkeypatch.setattr(serial_mod, "pyserial", types.SimpleNamespace(Serial=PipePort))
+    d = LocalSerialDep("FAKE", timeout=0.05, raw_writes=True)
+    d._ensure()
+    yield d, rfd
+    os.close(rfd)
+    os.close(wfd)
+
+
+def test_raw_writes_loop_over_short_writes_and_full_fd(
+    pipe_dep, monkeypatch: pytest.MonkeyPatch
+):
+    import os
+
+    dep, rfd = pipe_dep
+    real_write = os.write
+    calls: list[int] = []
+
+    def short_write(fd: int, data) -> int:  # type: ignore[no-untyped-def]
+        calls.append(len(data))
+        if len(calls) == 2:
+            raise BlockingIOError  # fd momentarily full
+        return real_write(fd, bytes(data[:7]))  # at most 7 bytes per call
+
+    waited: list[int] = []
+    real_select = serial_mod.select.select
+
+    def select(r, w, x, timeout):  # type: ignore[no-untyped-def]
+        waited.append(len(w))
+        return real_select(r, w, x, timeout)
+
+    monkeypatch.setattr(serial_mod.os, "write", short_write)
+    monkeypatch.setattr(serial_mod.select, "select", select)
+
+    payload = b"VOLT 1.234\nOPON\n"
+    assert dep.write(payload) == len(payload)
+    monkeypatch.undo()
+
+    assert os.read(rfd, 100) == payload
+    assert dep._serial.written == []  # pyserial's write was bypassed
+    assert len(calls) > 3 and waited == [1]
+
+
+def test_raw_writes_time_out_when_fd_stays_full(pipe_dep):
+    import os
+
+    dep, _ = pipe_dep
+    # Fill the pipe so the fd never becomes writable
+    while True:
+        try:
+            os.write(dep._fd, b"x" * 65536)
+        except BlockingIOError:
+            break
+    with pytest.raises(TimeoutError):
+        dep.write(b"more\n")
+
+
+class _NoLowLatencyPort:
+    """Port whose driver has no ASYNC_LOW_LATENCY support."""
+
+    port = "/dev/ttyFAKE0"
+
+    def set_low_latency_mode(self, enabled: bool) -> None:
+        raise OSError("ioctl TIOCSSERIAL failed")
+
+
+def _deny_open(*_, **__):  # type: ignore[no-untyped-def]
+    raise PermissionError("read-only sysfs")
+
+
+def test_set_low_latency_without_fileno_falls_back(monkeypatch: pytest.MonkeyPatch):
+    class ClosedPort(_NoLowLatencyPort):
+        def set_low_latency_mode(self, enabled: bool) -> None:
+            # pyserial passes fd=None straight to fcntl.ioctl when not open
+            raise TypeError("argument must be an int, or have a fileno() method")
+
+    monkeypatch.setattr(serial_mod, "open", _deny_open, raising=False)
+    assert serial_mod.set_low_latency(ClosedPort()) is False
+
+
+def test_set_low_latency_ioctl_failure_uses_sysfs(monkeypatch: pytest.MonkeyPatch):
+    import io
+
+    written: dict[str, str] = {}
+
+    class Sink(io.StringIO):
+        def __init__(self, path: str):
+            super().__init__()
+            self.path = path
+
+        def close(self) -> None:
+            written[self.path] = self.getvalue()
+            super().close()
+
+    monkeypatch.setattr(serial_mod, "open", lambda path, mode: Sink(path), raising=False)
+    assert serial_mod.set_low_latency(_NoLowLatencyPort()) is True
+    assert written == {"/sys/bus/usb-serial/devices/ttyFAKE0/latency_timer": "1"}
+
+
+def test_set_low_latency_sysfs_not_writable(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(serial_mod, "open", _deny_open, raising=False)
+    assert serial_mod.set_low_latency(_NoLowLatencyPort()) is False
+    # No port path at all: nothing to fall back to
+    port = _NoLowLatencyPort()
+    port.port = None  # type: ignore[assignment]
+    assert serial_mod.set_low_latency(port) is False
+
+
+@pytest.mark.parametrize("low_latency", [True, False])
+def test_local_serial_dep_low_latency_opt_out(
+    monkeypatch: pytest.MonkeyPatch, low_latency: bool
+):
+    calls: list[object] = []
+    monkeypatch.setattr(serial_mod, "pyserial", types.SimpleNamespace(Serial=FakePort))
+    monkeypatch.setattr(serial_mod, "set_low_latency", lambda ser: calls.append(ser) or True)
+    d = LocalSerialDep("FAKE", low_latency=low_latency)
+    d._ensure()
+    assert len(calls) == int(low_latency)
+    assert d.low_latency_active is low_latency
+
+
+@pytest.mark.parametrize("low_latency", [True, False])
+def test_serial_inst_connect_requests_low_latency(
+    monkeypatch: pytest.MonkeyPatch, low_latency: bool
+):
+    from lab_wizard.lib.instruments.general import serial_inst_old
+
+    calls: list[object] = []
+    monkeypatch.setattr(serial_inst_old, "set_low_latency", calls.append)
+    inst = serial_inst_old.serialInst("FAKE", low_latency=low_latency)
+    inst.connect()
+    assert calls == ([inst.serial] if low_latency else [])
+    inst.disconnect()
+
+
+def test_is_open_tracks_the_underlying_port(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(serial_mod, "pyserial", types.SimpleNamespace(Serial=FakePort))
+    d = LocalSerialDep("FAKE")
+    assert not d.is_open  # opened lazily
+    d._ensure()
+    assert d.is_open
+    d._serial.close()  # e.g. pyserial closed it after the device vanished
+    assert not d.is_open
+    d.close()
+    assert not d.is_open
@@ -0,0 +1,53 @@
+from lab_wizard.lib.instruments.sim900.deps import Sim900Dep
+from lab_wizard.lib.instruments.sim900.sim900 import Sim900, Sim900Params
+
+
+class ScriptedSerial:
+    """SerialDep stand-in that records writes and replays canned read chunks."""
+
+    def __init__(self, chunks: list[bytes]):
+        self.written: list[bytes] = []
+        self.chunks = chunks
+
+    def write(self, data: bytes) -> int:
+        self.written.append(data)
+        return len(data)
+
+    def read(self, size: int | None = None) -> bytes:
+        return self.chunks.pop(0) if self.chunks else b""
+
+
+def test_query_batch_sends_one_write_and_orders_replies():
+    serial = ScriptedSerial([b"1.0\r\n2.", b"0\r\n"])
+    sim900 = Sim900(Sim900Dep(serial, 2), Sim900Params())  # type: ignore[arg-type]
+    sim900._comm.query_timeout = 0.05
+
+    replies = sim900.query_batch([(1, "VOLT? 1"), (1, "VOLT? 2"), (5, "RVAL?")])
+
+    assert serial.written == [
+        b'++addr 2\nCONN 1, "esc"\r\nVOLT? 1\r\nesc\n'
+        b'CONN 1, "esc"\r\nVOLT? 2\r\nesc\n'
+        b'CONN 5, "esc"\r\nRVAL?\r\nesc\n'
+    ]
+    # The third reply never arrives and is reported empty after the timeout
+    assert replies == [b"1.0\r\n", b"2.0\r\n", b""]
+    assert sim900.query_batch([]) == []
+
+
+def test_sim900_slot_writes_send_expected_bytes():
+    from lab_wizard.lib.instruments.general.serial import LocalSerialDep
+    from lab_wizard.lib.instruments.sim900.comm import Sim900ChildDep
+    from lab_wizard.lib.instruments.sim900.modules.sim928 import Sim928, Sim928Params
+
+    # LocalSerialDep over the conftest fake serial, which records the last write
+    dep = LocalSerialDep("FAKE")
+    slot_dep = Sim900ChildDep(dep, 2, 3)
+
+    slot_dep.write_many(["VOLT 1.000", "OPON"])
+    assert dep._serial._last == b'++addr 2\nCONN 3, "esc"\r\nVOLT 1.000\r\nOPON\r\nesc\n'
+    assert slot_dep.write_many([]) == 0
+
+    sim928 = Sim928(slot_dep, Sim928Params())
+    assert sim928.set_voltage_and_turn_on(1.5)
+    # Address 2 is still selected on the adapter, so no ++addr this time
+    assert dep._serial._last == b'CONN 3, "esc"\r\nVOLT 1.500\r\nOPON\r\nesc\n'
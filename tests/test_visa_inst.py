@@ -0,0 +1,79 @@
+import pytest
+
+from lab_wizard.lib.instruments.general import visa_inst
+from lab_wizard.lib.instruments.general.visa_inst import VisaInst
+
+
+class FakeResource:
+    timeout = 5000
+
+    def __init__(self):
+        self.written: list[str] = []
+        self.closed = False
+
+    def write(self, cmd: str) -> int:
+        self.written.append(cmd)
+        return len(cmd)
+
+    def read(self) -> str:
+        return "r"
+
+    def query(self, cmd: str) -> str:
+        return f"reply:{cmd}"
+
+    def write_binary_values(self, cmd: str, values: list) -> int:
+        return len(values)
+
+    def close(self) -> None:
+        self.closed = True
+
+
+@pytest.fixture
+def resource(monkeypatch: pytest.MonkeyPatch) -> FakeResource:
+    res = FakeResource()
+
+    class FakeRM:
+        def __init__(self, *_):  # type: ignore[no-untyped-def]
+            pass
+
+        def open_resource(self, _name: str) -> FakeResource:
+            return res
+
+    monkeypatch.setattr(visa_inst.visa, "ResourceManager", FakeRM)
+    return res
+
+
+def test_io_bound_to_resource_until_disconnect(resource: FakeResource):
+    inst = VisaInst("10.0.0.1")
+    # Calls go straight to the resource's bound methods
+    assert inst.write == resource.write
+    assert inst.write("CONF") == 4
+    assert inst.query("READ?") == "reply:READ?"
+    assert resource.written == ["CONF"]
+
+    inst.disconnect()
+    assert resource.closed
+    assert "write" not in vars(inst) and "query" not in vars(inst)
+    with pytest.raises(RuntimeError, match="Not connected"):
+        inst.query("READ?")
+    with pytest.raises(RuntimeError, match="Not connected"):
+        inst.write("CONF")
+
+
+def test_offline_io_uses_stubs():
+    inst = VisaInst("10.0.0.1", offline=True)
+    assert inst.write("CONF") is True
+    assert inst.query("READ?") == ""
+    assert inst.read() == ""
+    assert inst.write_binary_values("DATA", [1, 2]) is True
+
+
+def test_subclass_overrides_are_not_shadowed(resource: FakeResource):
+    class Logged(VisaInst):
+        def write(self, cmd: str) -> int:
+            return super().write(f"LOG {cmd}")
+
+    inst = Logged("10.0.0.1")
+    assert "write" not in vars(inst)
+    inst.write("CONF")
+    assert resource.written == ["LOG CONF"]